@@ -0,0 +1,77 @@
+"""Local access log of the sidebar filter states sessions land on.
+
+The dashboard appends one JSON line per new filter state. After the first
+render of a server process, and again after the dataset changes, the
+background warmer replays the most frequent recent states, so popular views
+are cached before they are requested. Delete the log to reset the counts.
+"""
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+
+from filters import parse_filter_state
+
+ACCESS_LOG_PATH = 'data/access_log.jsonl'
+
+# Only the most recent entries count towards a state's frequency. The log is
+# rewritten with the last ACCESS_LOG_WINDOW entries once it holds twice as many.
+ACCESS_LOG_WINDOW = 10_000
+
+# Number of filter states the warmer replays
+HOT_STATE_COUNT = 16
+
+_write_lock = threading.Lock()
+_appended = 0
+
+
+def record_filter_state(state, path=ACCESS_LOG_PATH, window=ACCESS_LOG_WINDOW):
+    """Append a filter state to the access log, compacting it every window appends."""
+    global _appended
+    entry = json.dumps({'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'filters': state._asdict()})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _write_lock:
+        with open(path, 'a') as f:
+            f.write(entry + '\n')
+        _appended += 1
+        if _appended % window == 0:
+            _compact(path, window)
+
+
+def compact_access_log(path=ACCESS_LOG_PATH, window=ACCESS_LOG_WINDOW):
+    """Rewrite the log with its last window entries if it holds more than twice that many."""
+    with _write_lock:
+        _compact(path, window)
+
+
+def _compact(path, window):
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
+        lines = f.readlines()
+    if len(lines) <= 2 * window:
+        return
+    # Replace atomically so a concurrent reader sees the old or the new log
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.writelines(lines[-window:])
+    os.replace(tmp_path, path)
+
+
+def hot_filter_states(k=HOT_STATE_COUNT, path=ACCESS_LOG_PATH, window=ACCESS_LOG_WINDOW):
+    """The k most frequent filter states among the last window entries, most frequent first."""
+    compact_access_log(path, window)
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        recent = deque(f, maxlen=window)
+
+    counts = Counter()
+    for line in recent:
+        try:
+            counts[parse_filter_state(json.loads(line)['filters'])] += 1
+        except (ValueError, KeyError, TypeError):
+            # Truncated or hand-edited line
+            continue
+    return [state for state, _ in counts.most_common(k)]
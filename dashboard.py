@@ -1,9 +1,24 @@
+import startup
+
+# Times this script run from before its imports; the first run per process is reported
+run_timer = startup.RunTimer()
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import numpy as np
-import ast
+import json
+import threading
+from dataset import dataset_version, read_shows
+from scoring import COMPONENT_COLUMNS, COMPONENT_LABELS, optional_components, rank_stability
+from episodes import EpisodeStore, season_metrics
+from profiles import (
+    DEFAULT_PROFILE, DEFAULT_PROFILE_NAME, PROFILE_CACHE_SIZE, SEASON_PREFERENCES, SEASON_PREFERENCE_LABELS,
+    dataset_fingerprint, delete_profile, load_profiles, profile_key, rank_shows, save_profile
+)
+from snapshot import read_figure, read_snapshot
+from filters import DEFAULT_FILTER_STATE, FILTER_CACHE_SIZE, apply_filters, filter_state
+from access_log import hot_filter_states, record_filter_state
+import views
+
+run_timer.mark('imports')
 
 # Page config
 st.set_page_config(
@@ -233,14 +248,104 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load data
+# Load data. Keyed on the dataset files' modification times, so an updated CSV
+# or episode store is reloaded, and warmed again under its new fingerprint,
+# without a restart
+@st.cache_data(max_entries=2)
+def load_data(version):
+    return read_shows()
+
 @st.cache_data
-def load_data():
-    df = pd.read_csv('data/processed/final_scores_all_shows.csv')
-    df['genres'] = df['genres'].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else [])
-    return df
+def load_rank_stability(dataset_key, n_samples, concentration):
+    return rank_stability(load_data(dataset_version()), n_samples=n_samples, concentration=concentration)
+
+@st.cache_data(max_entries=2)
+def load_dataset_fingerprint(version):
+    return dataset_fingerprint(load_data(version))
 
-df = load_data()
+# Personalized rankings are keyed by profile contents and dataset fingerprint, so
+# an entry is only invalidated when either changes; least recently used entries
+# are evicted past PROFILE_CACHE_SIZE. Returned frames are shared - do not mutate.
+@st.cache_resource(max_entries=PROFILE_CACHE_SIZE, show_spinner=False)
+def load_profile_ranking(profile_json, dataset_key):
+    return rank_shows(load_data(dataset_version()), json.loads(profile_json))
+
+# Pre-rendered default view from snapshot.py; None when missing or stale
+@st.cache_data(show_spinner=False)
+def load_snapshot(dataset_key):
+    return read_snapshot(dataset_key)
+
+# Shared figure objects - do not mutate
+@st.cache_resource(show_spinner=False)
+def load_snapshot_figure(path):
+    return read_figure(path)
+
+# Filtered rankings, keyed like profile rankings plus the normalized filter
+# state. Returned frames are shared - do not mutate.
+@st.cache_resource(max_entries=FILTER_CACHE_SIZE, show_spinner=False)
+def load_filtered_ranking(profile_json, dataset_key, filters):
+    return apply_filters(load_profile_ranking(profile_json, dataset_key), filters)
+
+# Genre stats for the current filter state, computed in one grouped pass
+@st.cache_data(show_spinner=False)
+def load_genre_analytics(profile_json, dataset_key, filters):
+    return views.genre_analytics(load_filtered_ranking(profile_json, dataset_key, filters))
+
+# Live Visualizations tab figures, named as in the snapshot. Shared figure
+# objects - do not mutate
+@st.cache_resource(max_entries=FILTER_CACHE_SIZE, show_spinner=False)
+def load_filter_figures(profile_json, dataset_key, filters):
+    filtered_df = load_filtered_ranking(profile_json, dataset_key, filters)
+    genre_stats, cooccurrence = load_genre_analytics(profile_json, dataset_key, filters)
+    return {
+        'histogram': views.score_histogram(filtered_df),
+        'scatter': views.score_scatter(filtered_df),
+        'heatmap': views.component_heatmap(filtered_df),
+        'genre': views.genre_bar(genre_stats),
+        'genre_cooccurrence': views.genre_cooccurrence(cooccurrence),
+    }
+
+@st.cache_data
+def load_season_metrics(show_id, dataset_key):
+    return season_metrics(EpisodeStore(), show_id)
+
+def warm_caches(dataset_key):
+    """Fill the caches that other tabs and saved profiles need."""
+    startup.import_deferred()
+    # Rankings for every saved profile, so switching is a cache hit
+    for profile in list(load_profiles().values())[:PROFILE_CACHE_SIZE]:
+        load_profile_ranking(profile_key(profile), dataset_key)
+    # Default Visualizations tab
+    snapshot = load_snapshot(dataset_key)
+    if snapshot is None:
+        load_filter_figures(profile_key(DEFAULT_PROFILE), dataset_key, DEFAULT_FILTER_STATE)
+    else:
+        for path in snapshot['figures'].values():
+            load_snapshot_figure(path)
+    # Most frequent filter states in the access log, under the default profile
+    for filters in hot_filter_states():
+        load_filter_figures(profile_key(DEFAULT_PROFILE), dataset_key, filters)
+
+# Warming runs on a background thread once per dataset fingerprint per process.
+# Streamlit only runs this script when a session connects, so it starts after
+# the first session's first render (not at process start), and again on the
+# first run after the dataset files change. The thread has no script run
+# context, so the functions it calls are cached without a spinner.
+@st.cache_resource(show_spinner=False)
+def start_warmup(dataset_key):
+    thread = threading.Thread(target=warm_caches, args=(dataset_key,), name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+data_version = dataset_version()
+df = load_data(data_version)
+dataset_key = load_dataset_fingerprint(data_version)
+snapshot = load_snapshot(dataset_key)
+has_episode_metrics = 'episode_rating_std' in df.columns
+all_genres = sorted(list(set([g for genres in df['genres'] for g in genres])))
+saved_profiles = load_profiles()
+
+run_timer.mark('data')
 
 # Header
 st.markdown("<h1>TV Background Analyzer</h1>", unsafe_allow_html=True)
@@ -252,6 +357,82 @@ plot complexity, episodic structure, and cultural familiarity.
 </div>
 """, unsafe_allow_html=True)
 
+# Sidebar profile
+st.sidebar.markdown("<h2>Profile</h2>", unsafe_allow_html=True)
+
+# A profile saved on the previous run becomes the selection before the widget exists
+if "pending_profile" in st.session_state:
+    st.session_state["profile"] = st.session_state.pop("pending_profile")
+
+active_profile_name = st.sidebar.selectbox(
+    "Preference Profile",
+    options=list(saved_profiles),
+    key="profile",
+    help="Rank shows using your own component weights, genre preferences and season length"
+)
+active_profile = saved_profiles[active_profile_name]
+personalized = active_profile_name != DEFAULT_PROFILE_NAME
+
+with st.sidebar.expander("Edit Profile"):
+    profile_name = st.text_input(
+        "Profile Name",
+        value=active_profile_name if personalized else "",
+        placeholder="New profile name..."
+    )
+    
+    edited_weights = {}
+    for column, label in list(zip(COMPONENT_COLUMNS, COMPONENT_LABELS)) + optional_components(df):
+        edited_weights[column] = st.slider(
+            f"{label} Weight",
+            min_value=0,
+            max_value=100,
+            value=int(round(active_profile['weights'].get(column, 0.0) * 100))
+        ) / 100
+    
+    boosts = active_profile['genre_boosts']
+    boosted_genres = st.multiselect(
+        "Boost Genres",
+        options=all_genres,
+        default=[g for g, v in boosts.items() if v > 0 and g in all_genres]
+    )
+    penalized_genres = st.multiselect(
+        "Penalize Genres",
+        options=all_genres,
+        default=[g for g, v in boosts.items() if v < 0 and g in all_genres]
+    )
+    genre_strength = st.slider(
+        "Genre Adjustment",
+        min_value=0,
+        max_value=25,
+        value=int(round(max([abs(v) for v in boosts.values()], default=0.1) * 100)),
+        help="Points added for each boosted genre and subtracted for each penalized genre"
+    ) / 100
+    
+    season_preference = st.selectbox(
+        "Season Length",
+        options=list(SEASON_PREFERENCES),
+        index=list(SEASON_PREFERENCES).index(active_profile['season_preference']),
+        format_func=SEASON_PREFERENCE_LABELS.get
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Save", use_container_width=True, disabled=not profile_name or profile_name == DEFAULT_PROFILE_NAME):
+            genre_boosts = {g: genre_strength for g in boosted_genres}
+            genre_boosts.update({g: -genre_strength for g in penalized_genres})
+            save_profile(profile_name, {
+                'weights': edited_weights,
+                'genre_boosts': genre_boosts,
+                'season_preference': season_preference,
+            })
+            st.session_state["pending_profile"] = profile_name
+            st.rerun()
+    with col2:
+        if st.button("Delete", use_container_width=True, disabled=not personalized):
+            delete_profile(active_profile_name)
+            st.session_state["pending_profile"] = DEFAULT_PROFILE_NAME
+            st.rerun()
+
 # Sidebar filters
 st.sidebar.markdown("<h2>Filters</h2>", unsafe_allow_html=True)
 
@@ -281,7 +462,6 @@ score_range = st.sidebar.slider(
 )
 
 # Genre filter
-all_genres = sorted(list(set([g for genres in df['genres'] for g in genres])))
 selected_genres = st.sidebar.multiselect(
     "Genres",
     options=all_genres,
@@ -309,40 +489,23 @@ st.sidebar.markdown("<br>", unsafe_allow_html=True)
 if st.sidebar.button("Reset All Filters", use_container_width=True):
     st.rerun()
 
-# Apply filters
-filtered_df = df.copy()
-
-# Apply search filter
-if search_query:
-    filtered_df = filtered_df[filtered_df['name'].str.contains(search_query, case=False, na=False)]
-
-# Apply other filters
-filtered_df = filtered_df[
-    (filtered_df['background_score_100'] >= score_range[0]) &
-    (filtered_df['background_score_100'] <= score_range[1]) &
-    (filtered_df['num_seasons'] >= season_range[0]) &
-    (filtered_df['num_seasons'] <= season_range[1])
-]
-
-# Genre filter
-if selected_genres:
-    filtered_df = filtered_df[filtered_df['genres'].apply(
-        lambda x: any(genre in x for genre in selected_genres)
-    )]
+# Apply filters to the profile's cached ranking, which is already sorted by
+# profile score (identical to background score for the default profile)
+season_bounds = (int(df['num_seasons'].min()), int(df['num_seasons'].max()))
+current_filters = filter_state(
+    search_query, top_n_filter, score_range, selected_genres, season_range, reddit_filter, season_bounds
+)
+default_filters = current_filters == DEFAULT_FILTER_STATE
+filtered_df = load_filtered_ranking(profile_key(active_profile), dataset_key, current_filters)
 
-# Reddit data filter
-if reddit_filter == "With Reddit Data":
-    filtered_df = filtered_df[filtered_df['has_reddit_data'] == True]
-elif reddit_filter == "Without Reddit Data":
-    filtered_df = filtered_df[filtered_df['has_reddit_data'] == False]
+# Log each new filter state a default-profile session lands on, for the warmer
+# to replay; personalized rankings aren't shared between users
+if not default_filters and not personalized and st.session_state.get("logged_filters") != current_filters:
+    record_filter_state(current_filters)
+    st.session_state["logged_filters"] = current_filters
 
-# Sort by background score for Top N filter
-filtered_df = filtered_df.sort_values('background_score_100', ascending=False)
-
-# Apply Top N filter
-if top_n_filter != "All Shows":
-    n = int(top_n_filter.split()[1])
-    filtered_df = filtered_df.head(n)
+# The default view is served from the snapshot; anything else is computed live
+use_snapshot = snapshot is not None and default_filters and not personalized
 
 # Results summary in sidebar
 st.sidebar.markdown("---")
@@ -350,6 +513,8 @@ st.sidebar.markdown(f"**Results:** {len(filtered_df)} shows")
 
 # Show active filters
 active_filters = []
+if personalized:
+    active_filters.append(f"Profile: {active_profile_name}")
 if search_query:
     active_filters.append(f"Search: '{search_query}'")
 if top_n_filter != "All Shows":
@@ -358,7 +523,7 @@ if selected_genres:
     active_filters.append(f"Genres: {len(selected_genres)}")
 if score_range != (0, 100):
     active_filters.append(f"Score: {score_range[0]}-{score_range[1]}")
-if season_range != (int(df['num_seasons'].min()), int(df['num_seasons'].max())):
+if season_range != season_bounds:
     active_filters.append(f"Seasons: {season_range[0]}-{season_range[1]}")
 if reddit_filter != "All Shows":
     active_filters.append(f"{reddit_filter}")
@@ -368,435 +533,393 @@ if active_filters:
     for filter_text in active_filters:
         st.sidebar.markdown(f"• {filter_text}")
 
-# Main content tabs
-tab1, tab2, tab3, tab4 = st.tabs(["Rankings", "Visualizations", "Show Details", "Methodology"])
+# Weight sensitivity analysis
+st.sidebar.markdown("---")
+weight_sensitivity = st.sidebar.checkbox(
+    "Weight Sensitivity Analysis",
+    value=False,
+    help="Re-rank every show under thousands of randomly perturbed component weights"
+)
+
+if weight_sensitivity:
+    weight_uncertainty = st.sidebar.select_slider(
+        "Weight Uncertainty",
+        options=["Low", "Medium", "High"],
+        value="Medium",
+        help="How far sampled weights may stray from the default 30/25/20/15/10 split"
+    )
+    n_weight_samples = st.sidebar.selectbox(
+        "Weight Samples",
+        options=[1000, 5000, 10000],
+        index=2,
+        format_func=lambda x: f"{x:,}"
+    )
+    concentration = {"Low": 300.0, "Medium": 100.0, "High": 30.0}[weight_uncertainty]
+    stability_df, rank_histogram = load_rank_stability(dataset_key, n_weight_samples, concentration)
+    stability_top_n = int(top_n_filter.split()[1]) if top_n_filter != "All Shows" else 10
+
+run_timer.mark('sidebar')
+
+# Main content tabs. Only the open tab's body runs; switching tabs reruns the script
+tab1, tab2, tab3, tab4 = st.tabs(
+    ["Rankings", "Visualizations", "Show Details", "Methodology"],
+    key="tab",
+    on_change="rerun"
+)
+
+# Closed tabs don't run their widgets, and Streamlit drops the state of widgets
+# that aren't rendered. Reassigning the keyed values keeps them across tab switches
+for key in ("sort_by", "sort_order", "selected_show"):
+    if key in st.session_state:
+        st.session_state[key] = st.session_state[key]
 
 # Tab 1: Rankings
 with tab1:
-    st.markdown("<h2>Show Rankings</h2>", unsafe_allow_html=True)
-    
-    # Sort options
-    col1, col2, col3 = st.columns([2, 1, 3])
-    with col1:
-        sort_by = st.selectbox(
-            "Sort by",
-            options=['background_score_100', 'vote_average', 'popularity', 'num_seasons', 'num_episodes'],
-            format_func=lambda x: {
-                'background_score_100': 'Background Score',
-                'vote_average': 'IMDb Rating',
-                'popularity': 'Popularity',
-                'num_seasons': 'Number of Seasons',
-                'num_episodes': 'Number of Episodes'
-            }[x],
-            label_visibility="collapsed"
+    if tab1.open:
+        st.markdown("<h2>Show Rankings</h2>", unsafe_allow_html=True)
+        
+        # Sort options
+        sort_options = (
+            (['profile_score_100'] if personalized else []) +
+            ['background_score_100', 'vote_average', 'popularity', 'num_seasons', 'num_episodes'] +
+            (['episode_consistency'] if has_episode_metrics else [])
+        )
+        # A kept sort column can disappear with the profile or the episode store
+        if st.session_state.get("sort_by") not in sort_options:
+            st.session_state.pop("sort_by", None)
+        col1, col2, col3 = st.columns([2, 1, 3])
+        with col1:
+            sort_by = st.selectbox(
+                "Sort by",
+                options=sort_options,
+                format_func=lambda x: {
+                    'profile_score_100': 'Profile Score',
+                    'background_score_100': 'Background Score',
+                    'vote_average': 'IMDb Rating',
+                    'popularity': 'Popularity',
+                    'num_seasons': 'Number of Seasons',
+                    'num_episodes': 'Number of Episodes',
+                    'episode_consistency': 'Episode Consistency'
+                }[x],
+                key="sort_by",
+                label_visibility="collapsed"
+            )
+        with col2:
+            sort_order = st.selectbox(
+                "Order", options=['Descending', 'Ascending'], key="sort_order", label_visibility="collapsed"
+            )
+        
+        # Sort dataframe. Profile scores are clipped to 100 for display, so the
+        # profile ordering comes from the rank, which follows the unclipped score
+        if sort_by == 'profile_score_100':
+            sorted_df = filtered_df.sort_values('profile_rank', ascending=(sort_order == 'Descending'))
+        else:
+            sorted_df = filtered_df.sort_values(
+                sort_by, 
+                ascending=(sort_order == 'Ascending')
+            )
+        
+        # The snapshot holds the default background-score ordering
+        snapshot_table = use_snapshot and sort_by == 'background_score_100' and sort_order == 'Descending'
+        summary = snapshot['summary'] if snapshot_table else views.rankings_summary(sorted_df)
+        
+        # Quick stats
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Shows", summary['total_shows'])
+        with col2:
+            st.metric("Average Score", f"{summary['average_score']:.1f}")
+        with col3:
+            st.metric("Highest Rated", f"{summary['highest_rated']:.1f}/10")
+        with col4:
+            st.metric("Total Episodes", f"{summary['total_episodes']:,}")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Display table
+        display_df = snapshot['table'] if snapshot_table else views.rankings_table(sorted_df)
+        
+        if personalized:
+            display_df.insert(1, 'Profile Score', sorted_df['profile_score_100'].round(1))
+        
+        # Rank stability columns
+        if weight_sensitivity:
+            stability = stability_df.loc[sorted_df.index]
+            display_df.insert(1, 'Rank', stability['default_rank'])
+            display_df.insert(2, 'Mean Rank', stability['mean_rank'].round(1))
+            display_df.insert(3, 'Rank 90% CI', [
+                f"{low}-{high}" for low, high in zip(stability['rank_ci_low'], stability['rank_ci_high'])
+            ])
+            display_df.insert(4, f'P(Top {stability_top_n})', (stability[f'p_top_{stability_top_n}'] * 100).round(1))
+            st.markdown(
+                f"<p style='color: #666666;'>Ranks across {n_weight_samples:,} sampled weight vectors "
+                f"({weight_uncertainty.lower()} uncertainty). P(Top {stability_top_n}) is the percentage of samples "
+                f"placing the show in the Top {stability_top_n}.</p>",
+                unsafe_allow_html=True
+            )
+        
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            height=600,
+            hide_index=True
+        )
+        
+        # Download button
+        st.markdown("<br>", unsafe_allow_html=True)
+        csv = snapshot['csv'] if snapshot_table else views.rankings_csv(sorted_df, personalized)
+        st.download_button(
+            label="Download Filtered Data",
+            data=csv,
+            file_name="tv_background_scores.csv",
+            mime="text/csv"
         )
-    with col2:
-        sort_order = st.selectbox("Order", options=['Descending', 'Ascending'], label_visibility="collapsed")
-    
-    # Sort dataframe
-    sorted_df = filtered_df.sort_values(
-        sort_by, 
-        ascending=(sort_order == 'Ascending')
-    )
-    
-    # Quick stats
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Shows", len(sorted_df))
-    with col2:
-        st.metric("Average Score", f"{sorted_df['background_score_100'].mean():.1f}")
-    with col3:
-        st.metric("Highest Rated", f"{sorted_df['vote_average'].max():.1f}/10")
-    with col4:
-        st.metric("Total Episodes", f"{sorted_df['num_episodes'].sum():,}")
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # Display table
-    display_df = sorted_df[[
-        'name', 'background_score_100', 'vote_average', 'num_seasons', 
-        'num_episodes', 'genres'
-    ]].copy()
-    
-    # Rename columns for display
-    display_df.columns = [
-        'Show', 'Background Score', 'IMDb Rating', 'Seasons', 
-        'Episodes', 'Genres'
-    ]
-    
-    # Format scores
-    display_df['Background Score'] = display_df['Background Score'].round(1)
-    display_df['Genres'] = display_df['Genres'].apply(lambda x: ', '.join(x[:3]))
-    
-    st.dataframe(
-        display_df,
-        use_container_width=True,
-        height=600,
-        hide_index=True
-    )
-    
-    # Download button
-    st.markdown("<br>", unsafe_allow_html=True)
-    csv = sorted_df.to_csv(index=False)
-    st.download_button(
-        label="Download Filtered Data",
-        data=csv,
-        file_name="tv_background_scores.csv",
-        mime="text/csv"
-    )
 
 # Tab 2: Visualizations
 with tab2:
-    st.markdown("<h2>Data Visualizations</h2>", unsafe_allow_html=True)
-    
-    # Visualization 1: Score distribution
-    st.markdown("<h3>Background Score Distribution</h3>", unsafe_allow_html=True)
-    fig_hist = px.histogram(
-        filtered_df,
-        x='background_score_100',
-        nbins=30,
-        labels={'background_score_100': 'Background Score'},
-        color_discrete_sequence=['#610099']
-    )
-    fig_hist.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis_title="Background Score",
-        yaxis_title="Number of Shows",
-        showlegend=False,
-        font=dict(family="Inter, sans-serif", color="#333333"),
-        xaxis=dict(gridcolor='#e5e5e5'),
-        yaxis=dict(gridcolor='#e5e5e5'),
-        margin=dict(t=20, b=0)
-    )
-    st.plotly_chart(fig_hist, use_container_width=True)
-    
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    
-    # Visualization 2: Scatter plot
-    st.markdown("<h3>Background Score vs IMDb Rating</h3>", unsafe_allow_html=True)
-    fig_scatter = px.scatter(
-        filtered_df,
-        x='vote_average',
-        y='background_score_100',
-        hover_data=['name', 'num_seasons'],
-        labels={
-            'vote_average': 'IMDb Rating',
-            'background_score_100': 'Background Score',
-            'name': 'Show'
-        },
-        color='genre_score',
-        color_continuous_scale=['#e5e5e5', '#432656', '#640c9c'],
-        size='popularity',
-        size_max=15
-    )
-    fig_scatter.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis_title="IMDb Rating",
-        yaxis_title="Background Score",
-        font=dict(family="Inter, sans-serif", color="#333333"),
-        xaxis=dict(gridcolor='#e5e5e5'),
-        yaxis=dict(gridcolor='#e5e5e5'),
-        coloraxis_colorbar=dict(title="Genre Score"),
-        margin=dict(t=20, b=0)
-    )
-    st.plotly_chart(fig_scatter, use_container_width=True)
-    
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    
-# Visualization 3: Component scores heatmap for top shows
-    st.markdown("<h3>Top 20 Shows - Component Analysis</h3>", unsafe_allow_html=True)
-    top_20 = filtered_df.nlargest(20, 'background_score_100')
-    
-    heatmap_data = top_20[['name', 'genre_score', 'description_score', 
-                            'episodic_score', 'popularity_score', 'reddit_score_normalized']].copy()
-    heatmap_data.columns = ['Show', 'Genre', 'Description', 'Episodic', 'Popularity', 'Reddit']
-    heatmap_data = heatmap_data.set_index('Show')
-    
-    # Create discrete color scale with balanced steps
-    fig_heatmap = go.Figure(data=go.Heatmap(
-        z=heatmap_data.values.T,
-        x=heatmap_data.index,
-        y=heatmap_data.columns,
-        colorscale=[
-            [0.0, '#f5f5f5'],    # 0.0-0.2: Very low - lightest gray
-            [0.2, '#d9d9d9'],    # 0.2-0.4: Low - light gray
-            [0.4, '#c9b3e0'],    # 0.4-0.6: Medium - light purple
-            [0.6, '#a580cc'],    # 0.6-0.8: Medium-high - medium purple
-            [0.8, '#7a3db8'],    # 0.8-1.0: High - darker purple
-            [1.0, '#610099']     # 1.0: Highest - your accent purple
-        ],
-        zmid=0.5,
-        colorbar=dict(
-            title="Score",
-            tickmode='array',
-            tickvals=[0.1, 0.3, 0.5, 0.7, 0.9],
-            ticktext=['0.0-0.2', '0.2-0.4', '0.4-0.6', '0.6-0.8', '0.8-1.0'],
-            tickfont=dict(color="#333333")
-        )
-    ))
-    
-    # Update text color based on background - white for darker, dark for lighter
-    annotations = []
-    for i, row in enumerate(heatmap_data.values.T):
-        for j, value in enumerate(row):
-            text_color = '#ffffff' if value > 0.6 else '#333333'
-            annotations.append(
-                dict(
-                    x=heatmap_data.index[j],
-                    y=heatmap_data.columns[i],
-                    text=f'{value:.2f}',
-                    showarrow=False,
-                    font=dict(color=text_color, size=10, family="Inter, sans-serif")
-                )
+    if tab2.open:
+        st.markdown("<h2>Data Visualizations</h2>", unsafe_allow_html=True)
+        
+        if use_snapshot:
+            fig_hist, fig_scatter, fig_heatmap, fig_genre, fig_cooccurrence = (
+                load_snapshot_figure(snapshot['figures'][name])
+                for name in ['histogram', 'scatter', 'heatmap', 'genre', 'genre_cooccurrence']
             )
-    
-    fig_heatmap.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis_title="",
-        yaxis_title="",
-        font=dict(family="Inter, sans-serif", color="#333333"),
-        height=400,
-        margin=dict(t=20, b=0),
-        annotations=annotations
-    )
-    
-    st.plotly_chart(fig_heatmap, use_container_width=True)
-    # Visualization 4: Genre breakdown
-    st.markdown("<h3>Average Background Score by Genre</h3>", unsafe_allow_html=True)
-    
-    genre_scores = []
-    for genre in all_genres:
-        genre_df = df[df['genres'].apply(lambda x: genre in x)]
-        if len(genre_df) > 0:
-            genre_scores.append({
-                'Genre': genre,
-                'Avg Score': genre_df['background_score_100'].mean(),
-                'Count': len(genre_df)
-            })
-    
-    genre_df_plot = pd.DataFrame(genre_scores).sort_values('Avg Score', ascending=False)
-    
-    fig_genre = px.bar(
-        genre_df_plot,
-        x='Genre',
-        y='Avg Score',
-        hover_data=['Count'],
-        labels={'Avg Score': 'Average Background Score'},
-        color='Avg Score',
-        color_continuous_scale=[[0, '#e5e5e5'], [0.5, '#8e52c7'], [1, '#610099']]
-    )
-    fig_genre.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis_title="Genre",
-        yaxis_title="Average Background Score",
-        xaxis_tickangle=-45,
-        font=dict(family="Inter, sans-serif", color="#333333"),
-        xaxis=dict(gridcolor='#e5e5e5'),
-        yaxis=dict(gridcolor='#e5e5e5'),
-        showlegend=False,
-        margin=dict(t=20, b=0)
-    )
-    st.plotly_chart(fig_genre, use_container_width=True)
+        else:
+            figures = load_filter_figures(profile_key(active_profile), dataset_key, current_filters)
+            fig_hist, fig_scatter, fig_heatmap, fig_genre, fig_cooccurrence = (
+                figures[name] for name in ['histogram', 'scatter', 'heatmap', 'genre', 'genre_cooccurrence']
+            )
+        
+        # Visualization 1: Score distribution
+        st.markdown("<h3>Background Score Distribution</h3>", unsafe_allow_html=True)
+        st.plotly_chart(fig_hist, use_container_width=True)
+        
+        st.markdown("<br><br>", unsafe_allow_html=True)
+        
+        # Visualization 2: Scatter plot
+        st.markdown("<h3>Background Score vs IMDb Rating</h3>", unsafe_allow_html=True)
+        st.plotly_chart(fig_scatter, use_container_width=True)
+        
+        st.markdown("<br><br>", unsafe_allow_html=True)
+        
+        # Visualization 3: Component scores heatmap for top shows
+        st.markdown("<h3>Top 20 Shows - Component Analysis</h3>", unsafe_allow_html=True)
+        st.plotly_chart(fig_heatmap, use_container_width=True)
+        # Visualization 4: Genre breakdown
+        st.markdown("<h3>Average Background Score by Genre</h3>", unsafe_allow_html=True)
+        st.plotly_chart(fig_genre, use_container_width=True)
+        
+        # Visualization 5: Genre co-occurrence
+        st.markdown("<h3>Genre Co-occurrence</h3>", unsafe_allow_html=True)
+        st.plotly_chart(fig_cooccurrence, use_container_width=True)
 
 # Tab 3: Show Details
 with tab3:
-    st.markdown("<h2>Individual Show Analysis</h2>", unsafe_allow_html=True)
-    
-    selected_show = st.selectbox(
-        "Select a show to analyze",
-        options=sorted(df['name'].unique()),
-        label_visibility="collapsed"
-    )
-    
-    show_data = df[df['name'] == selected_show].iloc[0]
-    
-    st.markdown(f"<h3>{selected_show}</h3>", unsafe_allow_html=True)
-    
-    # Display show info
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric("Background Score", f"{show_data['background_score_100']:.1f}")
-    with col2:
-        st.metric("IMDb Rating", f"{show_data['vote_average']:.1f}/10")
-    with col3:
-        st.metric("Seasons", int(show_data['num_seasons']))
-    with col4:
-        st.metric("Episodes", int(show_data['num_episodes']))
-    with col5:
-        reddit_status = "Available" if show_data['has_reddit_data'] else "N/A"
-        st.metric("Reddit Data", reddit_status)
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # Show overview
-    st.markdown("<h3>Overview</h3>", unsafe_allow_html=True)
-    st.markdown(f"<p style='color: #666666; line-height: 1.6;'>{show_data['overview']}</p>", unsafe_allow_html=True)
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # Two columns: radar chart and details
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.markdown("<h3>Component Scores</h3>", unsafe_allow_html=True)
-        
-        categories = ['Genre', 'Description', 'Episodic', 'Popularity', 'Reddit']
-        values = [
-            show_data['genre_score'],
-            show_data['description_score'],
-            show_data['episodic_score'],
-            show_data['popularity_score'],
-            show_data['reddit_score_normalized']
-        ]
-        
-        fig_radar = go.Figure()
-        fig_radar.add_trace(go.Scatterpolar(
-            r=values,
-            theta=categories,
-            fill='toself',
-            fillcolor='rgba(97, 0, 153, 0.3)',
-            line=dict(color='#610099', width=2),
-            name=selected_show
-        ))
-        fig_radar.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True, 
-                    range=[0, 1],
-                    gridcolor='#e5e5e5',
-                    tickfont=dict(color='#333333')
-                ),
-                angularaxis=dict(
-                    gridcolor='#e5e5e5',
-                    tickfont=dict(color='#333333')
-                ),
-                bgcolor='rgba(0,0,0,0)'
-            ),
-            showlegend=False,
-            height=350,
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family="Inter, sans-serif", color="#333333"),
-            margin=dict(t=20, b=20)
+    if tab3.open:
+        st.markdown("<h2>Individual Show Analysis</h2>", unsafe_allow_html=True)
+        
+        show_names = sorted(df['name'].unique())
+        if st.session_state.get("selected_show") not in show_names:
+            st.session_state.pop("selected_show", None)
+        selected_show = st.selectbox(
+            "Select a show to analyze",
+            options=show_names,
+            key="selected_show",
+            label_visibility="collapsed"
         )
-        st.plotly_chart(fig_radar, use_container_width=True)
-    
-    with col2:
-        st.markdown("<h3>Details</h3>", unsafe_allow_html=True)
         
-        st.markdown(f"""
-        <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5;'>
-            <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Genres:</strong> {', '.join(show_data['genres'])}</p>
-            <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>First Aired:</strong> {show_data['first_air_date']}</p>
-            <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Status:</strong> {show_data['status']}</p>
-            <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Type:</strong> {show_data['type']}</p>
-            <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Popularity:</strong> {show_data['popularity']:.0f}</p>
-            <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Episodes/Season:</strong> {show_data['avg_episodes_per_season']:.1f}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        show_data = df[df['name'] == selected_show].iloc[0]
+        
+        st.markdown(f"<h3>{selected_show}</h3>", unsafe_allow_html=True)
+        
+        # Display show info
+        col1, col2, col3, col4, col5 = st.columns(5)
+        
+        with col1:
+            st.metric("Background Score", f"{show_data['background_score_100']:.1f}")
+        with col2:
+            st.metric("IMDb Rating", f"{show_data['vote_average']:.1f}/10")
+        with col3:
+            st.metric("Seasons", int(show_data['num_seasons']))
+        with col4:
+            st.metric("Episodes", int(show_data['num_episodes']))
+        with col5:
+            reddit_status = "Available" if show_data['has_reddit_data'] else "N/A"
+            st.metric("Reddit Data", reddit_status)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Show overview
+        st.markdown("<h3>Overview</h3>", unsafe_allow_html=True)
+        st.markdown(f"<p style='color: #666666; line-height: 1.6;'>{show_data['overview']}</p>", unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Two columns: radar chart and details
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            st.markdown("<h3>Component Scores</h3>", unsafe_allow_html=True)
+            
+            # Radar charts only depend on the show, so the snapshot copy is always valid
+            if snapshot is not None and int(show_data['id']) in snapshot['shows']:
+                fig_radar = load_snapshot_figure(snapshot['shows'][int(show_data['id'])])
+            else:
+                fig_radar = views.component_radar(show_data)
+            st.plotly_chart(fig_radar, use_container_width=True)
+        
+        with col2:
+            st.markdown("<h3>Details</h3>", unsafe_allow_html=True)
+            
+            st.markdown(f"""
+            <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5;'>
+                <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Genres:</strong> {', '.join(show_data['genres'])}</p>
+                <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>First Aired:</strong> {show_data['first_air_date']}</p>
+                <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Status:</strong> {show_data['status']}</p>
+                <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Type:</strong> {show_data['type']}</p>
+                <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Popularity:</strong> {show_data['popularity']:.0f}</p>
+                <p style='margin: 0.5rem 0; color: #666666;'><strong style='color: #610099;'>Episodes/Season:</strong> {show_data['avg_episodes_per_season']:.1f}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Episode rating variance from the episode store
+        if has_episode_metrics and show_data['rated_episodes'] > 0:
+            st.markdown("<h3>Episode Ratings</h3>", unsafe_allow_html=True)
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Rated Episodes", int(show_data['rated_episodes']))
+            with col2:
+                st.metric("Rating Std Dev", f"{show_data['episode_rating_std']:.2f}")
+            with col3:
+                st.metric("Trend per 10 Episodes", f"{show_data['episode_rating_trend'] * 10:+.2f}")
+            with col4:
+                st.metric("Consistency", f"{show_data['episode_consistency']:.2f}")
+            
+            fig_seasons = views.season_ratings(load_season_metrics(int(show_data['id']), dataset_key))
+            st.plotly_chart(fig_seasons, use_container_width=True)
+        
+        # Rank stability under perturbed weights
+        if weight_sensitivity:
+            show_stability = stability_df.loc[show_data.name]
+            
+            st.markdown("<h3>Rank Stability</h3>", unsafe_allow_html=True)
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Default Rank", int(show_stability['default_rank']))
+            with col2:
+                st.metric("Mean Rank", f"{show_stability['mean_rank']:.1f}")
+            with col3:
+                st.metric("90% Rank Interval", f"{show_stability['rank_ci_low']}-{show_stability['rank_ci_high']}")
+            with col4:
+                st.metric(f"P(Top {stability_top_n})", f"{show_stability[f'p_top_{stability_top_n}'] * 100:.1f}%")
+            
+            fig_rank = views.rank_distribution(rank_histogram[df.index.get_loc(show_data.name)], len(df))
+            st.plotly_chart(fig_rank, use_container_width=True)
 
 # Tab 4: Methodology
 with tab4:
-    st.markdown("<h2>Methodology</h2>", unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div class="info-box">
-        <p><strong>This tool analyzes TV shows across five key dimensions to determine their suitability as background content while working or doing other activities.</strong></p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("<h3>Scoring Components</h3>", unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
+    if tab4.open:
+        st.markdown("<h2>Methodology</h2>", unsafe_allow_html=True)
+        
         st.markdown("""
-        <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
-            <h4 style='color: #610099; margin-top: 0;'>Genre Score (30%)</h4>
-            <p style='color: #666666; line-height: 1.6;'>
-            Evaluates genre suitability for background viewing. Comedies and family shows score higher, 
-            while thrillers and crime dramas score lower.
-            </p>
+        <div class="info-box">
+            <p><strong>This tool analyzes TV shows across five key dimensions to determine their suitability as background content while working or doing other activities.</strong></p>
         </div>
+        """, unsafe_allow_html=True)
         
-        <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
-            <h4 style='color: #610099; margin-top: 0;'>Description Score (25%)</h4>
-            <p style='color: #666666; line-height: 1.6;'>
-            Analyzes show descriptions for complexity indicators. Shows with simpler, comfort-oriented 
-            descriptions receive higher scores.
-            </p>
-        </div>
+        st.markdown("<h3>Scoring Components</h3>", unsafe_allow_html=True)
         
-        <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5;'>
-            <h4 style='color: #610099; margin-top: 0;'>Episodic Score (20%)</h4>
-            <p style='color: #666666; line-height: 1.6;'>
-            Based on episodes per season. More episodic shows (20+ episodes/season) score higher 
-            than heavily serialized shows (8-13 episodes/season).
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
-            <h4 style='color: #610099; margin-top: 0;'>Popularity Score (15%)</h4>
-            <p style='color: #666666; line-height: 1.6;'>
-            Cultural familiarity proxy. More popular shows are easier to follow casually since 
-            viewers may already know the premise and characters.
-            </p>
-        </div>
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
+                <h4 style='color: #610099; margin-top: 0;'>Genre Score (30%)</h4>
+                <p style='color: #666666; line-height: 1.6;'>
+                Evaluates genre suitability for background viewing. Comedies and family shows score higher, 
+                while thrillers and crime dramas score lower.
+                </p>
+            </div>
+            
+            <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
+                <h4 style='color: #610099; margin-top: 0;'>Description Score (25%)</h4>
+                <p style='color: #666666; line-height: 1.6;'>
+                Analyzes show descriptions for complexity indicators. Shows with simpler, comfort-oriented 
+                descriptions receive higher scores.
+                </p>
+            </div>
+            
+            <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5;'>
+                <h4 style='color: #610099; margin-top: 0;'>Episodic Score (20%)</h4>
+                <p style='color: #666666; line-height: 1.6;'>
+                Based on episodes per season. More episodic shows (20+ episodes/season) score higher 
+                than heavily serialized shows (8-13 episodes/season).
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
+                <h4 style='color: #610099; margin-top: 0;'>Popularity Score (15%)</h4>
+                <p style='color: #666666; line-height: 1.6;'>
+                Cultural familiarity proxy. More popular shows are easier to follow casually since 
+                viewers may already know the premise and characters.
+                </p>
+            </div>
+            
+            <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
+                <h4 style='color: #610099; margin-top: 0;'>Reddit Sentiment (10%)</h4>
+                <p style='color: #666666; line-height: 1.6;'>
+                Analyzes Reddit discussions for mentions of "background," "comfort," "rewatch," and related 
+                keywords. Lower weight due to limited data availability.
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown("<h3>Data Sources</h3>", unsafe_allow_html=True)
         
-        <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5; margin-bottom: 1rem;'>
-            <h4 style='color: #610099; margin-top: 0;'>Reddit Sentiment (10%)</h4>
-            <p style='color: #666666; line-height: 1.6;'>
-            Analyzes Reddit discussions for mentions of "background," "comfort," "rewatch," and related 
-            keywords. Lower weight due to limited data availability.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    st.markdown("<h3>Data Sources</h3>", unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5;'>
-        <p style='color: #666666; margin: 0.5rem 0;'><strong style='color: #610099;'>TMDb API:</strong> Show metadata, ratings, popularity, episode counts, and descriptions</p>
-        <p style='color: #666666; margin: 0.5rem 0;'><strong style='color: #610099;'>Reddit:</strong> User discussions and sentiment from relevant subreddits</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    st.markdown("<h3>Score Interpretation</h3>", unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div style='background-color: #e8f5e9; padding: 1.5rem; border-radius: 8px; border-left: 3px solid #4caf50;'>
-            <h4 style='color: #2e7d32; margin-top: 0;'>80 - 100</h4>
-            <p style='color: #1b5e20; margin: 0;'>Excellent background content. Episodic, lighthearted, doesn't require constant attention.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='background-color: #fff3e0; padding: 1.5rem; border-radius: 8px; border-left: 3px solid #ff9800;'>
-            <h4 style='color: #e65100; margin-top: 0;'>50 - 79</h4>
-            <p style='color: #bf360c; margin: 0;'>Moderate background potential. May require occasional attention but generally suitable.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
         st.markdown("""
-        <div style='background-color: #ffebee; padding: 1.5rem; border-radius: 8px; border-left: 3px solid #f44336;'>
-            <h4 style='color: #c62828; margin-top: 0;'>0 - 49</h4>
-            <p style='color: #b71c1c; margin: 0;'>Not recommended for background. Complex plots, intense themes, or heavy serialization.</p>
+        <div style='background-color: #ffffff; padding: 1.5rem; border-radius: 8px; border: 1px solid #e5e5e5;'>
+            <p style='color: #666666; margin: 0.5rem 0;'><strong style='color: #610099;'>TMDb API:</strong> Show metadata, ratings, popularity, episode counts, and descriptions</p>
+            <p style='color: #666666; margin: 0.5rem 0;'><strong style='color: #610099;'>Reddit:</strong> User discussions and sentiment from relevant subreddits</p>
         </div>
         """, unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown("<h3>Score Interpretation</h3>", unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("""
+            <div style='background-color: #e8f5e9; padding: 1.5rem; border-radius: 8px; border-left: 3px solid #4caf50;'>
+                <h4 style='color: #2e7d32; margin-top: 0;'>80 - 100</h4>
+                <p style='color: #1b5e20; margin: 0;'>Excellent background content. Episodic, lighthearted, doesn't require constant attention.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style='background-color: #fff3e0; padding: 1.5rem; border-radius: 8px; border-left: 3px solid #ff9800;'>
+                <h4 style='color: #e65100; margin-top: 0;'>50 - 79</h4>
+                <p style='color: #bf360c; margin: 0;'>Moderate background potential. May require occasional attention but generally suitable.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+            <div style='background-color: #ffebee; padding: 1.5rem; border-radius: 8px; border-left: 3px solid #f44336;'>
+                <h4 style='color: #c62828; margin-top: 0;'>0 - 49</h4>
+                <p style='color: #b71c1c; margin: 0;'>Not recommended for background. Complex plots, intense themes, or heavy serialization.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+run_timer.mark('tabs')
 
 # Footer
 st.markdown("""
@@ -811,4 +934,7 @@ st.markdown("""
     Created by Nikhil Thamma | Data Scientist & Analyst<br>
     Python • Streamlit • Plotly • TMDb API • NLP Sentiment Analysis
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+run_timer.finish()
+start_warmup(dataset_key)
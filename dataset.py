@@ -0,0 +1,34 @@
+import ast
+import os
+
+import pandas as pd
+
+from episodes import EPISODES_PATH, EpisodeStore, show_metrics, store_exists
+
+DATA_PATH = 'data/processed/final_scores_all_shows.csv'
+
+
+def dataset_version(path=DATA_PATH, episodes_path=EPISODES_PATH):
+    """Modification times of the dataset files, for keying caches on updates.
+
+    The episode store's offsets index is written last, so its mtime stands
+    for the whole store.
+    """
+    offsets = os.path.join(episodes_path, 'index_offsets.npy')
+    return (
+        os.stat(path).st_mtime_ns,
+        os.stat(offsets).st_mtime_ns if store_exists(episodes_path) else None,
+    )
+
+
+def read_shows(path=DATA_PATH, episodes_path=EPISODES_PATH):
+    """Read the processed show scores, parsing the genres column into lists.
+
+    When an episode store exists, its per-show rating metrics are joined on id
+    (NaN for shows without episodes).
+    """
+    df = pd.read_csv(path)
+    df['genres'] = df['genres'].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else [])
+    if store_exists(episodes_path):
+        df = df.join(show_metrics(EpisodeStore(episodes_path)), on='id')
+    return df
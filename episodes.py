@@ -0,0 +1,207 @@
+"""Episode-level ratings store and per-show rating-variance metrics.
+
+The store is a directory of memory-mapped columnar ``.npy`` arrays sorted by
+show, season and episode, plus an offsets index giving each show's row range.
+Build it with ``python episodes.py episodes.csv`` from a CSV with show_id,
+season, episode, rating and votes columns.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+EPISODES_PATH = 'data/episodes'
+
+# Column name -> on-disk dtype
+EPISODE_COLUMNS = {
+    'show_id': np.int32,
+    'season': np.int16,
+    'episode': np.int16,
+    'rating': np.float32,
+    'votes': np.int32,
+}
+
+# Rows reduced per block, so metrics over millions of episodes stay bounded
+BLOCK_ROWS = 1 << 20
+
+# Within-season rating standard deviation (points) at which episode_consistency
+# reaches 0
+CONSISTENCY_SCALE = 1.5
+
+SHOW_METRIC_COLUMNS = [
+    'rated_episodes',
+    'episode_votes',
+    'episode_rating_mean',
+    'episode_rating_std',
+    'episode_rating_trend',
+    'season_rating_std',
+    'episode_consistency',
+]
+
+
+class EpisodeStore:
+    """Read-only view over an on-disk episode store."""
+
+    def __init__(self, path=EPISODES_PATH):
+        self.path = path
+        for column in EPISODE_COLUMNS:
+            setattr(self, column, np.load(os.path.join(path, f'{column}.npy'), mmap_mode='r'))
+        self.show_ids = np.load(os.path.join(path, 'index_show_ids.npy'))
+        self.offsets = np.load(os.path.join(path, 'index_offsets.npy'))
+
+    def __len__(self):
+        return len(self.rating)
+
+    def show_rows(self, show_id):
+        """Row range [start, stop) of one show, empty if it has no episodes."""
+        i = np.searchsorted(self.show_ids, show_id)
+        if i == len(self.show_ids) or self.show_ids[i] != show_id:
+            return 0, 0
+        return int(self.offsets[i]), int(self.offsets[i + 1])
+
+    def blocks(self):
+        """Yield (first_show, last_show) index ranges covering about BLOCK_ROWS rows each.
+
+        Shows are never split across blocks.
+        """
+        first = 0
+        while first < len(self.show_ids):
+            target = self.offsets[first] + BLOCK_ROWS
+            last = int(np.searchsorted(self.offsets, target, side='right')) - 1
+            last = min(max(last, first + 1), len(self.show_ids))
+            yield first, last
+            first = last
+
+
+def store_exists(path=EPISODES_PATH):
+    return os.path.exists(os.path.join(path, 'index_offsets.npy'))
+
+
+def write_store(episodes, path=EPISODES_PATH):
+    """Write an episode DataFrame to a columnar store at path.
+
+    Rows without a rating are dropped. Rows are sorted by show, season and
+    episode so every show and every season is a contiguous segment.
+    """
+    episodes = episodes.dropna(subset=['rating'])
+    episodes = episodes.sort_values(['show_id', 'season', 'episode'], kind='stable')
+
+    os.makedirs(path, exist_ok=True)
+    for column, dtype in EPISODE_COLUMNS.items():
+        np.save(os.path.join(path, f'{column}.npy'), episodes[column].fillna(0).to_numpy(dtype=dtype))
+
+    show_id = episodes['show_id'].to_numpy(dtype=EPISODE_COLUMNS['show_id'])
+    show_ids, starts = np.unique(show_id, return_index=True)
+    np.save(os.path.join(path, 'index_show_ids.npy'), show_ids)
+    np.save(os.path.join(path, 'index_offsets.npy'), np.append(starts, len(show_id)).astype(np.int64))
+
+
+def _segment_stats(values, starts):
+    """Count, mean, population std and OLS trend of contiguous segments.
+
+    The trend is the slope of value against position within the segment.
+    """
+    counts = np.diff(np.append(starts, len(values)))
+    mean = np.add.reduceat(values, starts) / counts
+    deviation = values - np.repeat(mean, counts)
+    std = np.sqrt(np.add.reduceat(deviation ** 2, starts) / counts)
+
+    position = np.arange(len(values)) - np.repeat(starts, counts)
+    centred = position - np.repeat((counts - 1) / 2.0, counts)
+    spread = np.add.reduceat(centred ** 2, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        trend = np.where(spread > 0, np.add.reduceat(centred * deviation, starts) / spread, 0.0)
+
+    return counts, mean, std, trend
+
+
+def _season_starts(store, start, stop):
+    """Segment starts (relative to start) of each (show, season) in a row range."""
+    season = np.asarray(store.season[start:stop])
+    show_id = np.asarray(store.show_id[start:stop])
+    new_season = np.ones(stop - start, dtype=bool)
+    new_season[1:] = (season[1:] != season[:-1]) | (show_id[1:] != show_id[:-1])
+    return np.flatnonzero(new_season)
+
+
+def show_metrics(store):
+    """Per-show episode rating metrics, indexed by show id.
+
+    Reductions run over contiguous show and season segments a block of shows
+    at a time, so peak memory is bounded by BLOCK_ROWS rather than the store.
+    """
+    parts = []
+    for first, last in store.blocks():
+        start, stop = int(store.offsets[first]), int(store.offsets[last])
+        rating = np.asarray(store.rating[start:stop], dtype=np.float64)
+        show_starts = store.offsets[first:last] - start
+
+        counts, mean, std, trend = _segment_stats(rating, show_starts)
+        votes = np.add.reduceat(np.asarray(store.votes[start:stop], dtype=np.int64), show_starts)
+
+        # Average within-season spread, so a show whose quality drifts across
+        # seasons isn't penalized in episode_consistency
+        season_starts = _season_starts(store, start, stop)
+        _, _, season_std, _ = _segment_stats(rating, season_starts)
+        seasons_per_show = np.diff(np.searchsorted(season_starts, np.append(show_starts, stop - start)))
+        first_season = np.searchsorted(season_starts, show_starts)
+        season_rating_std = np.add.reduceat(season_std, first_season) / seasons_per_show
+
+        parts.append(pd.DataFrame({
+            'rated_episodes': counts,
+            'episode_votes': votes,
+            'episode_rating_mean': mean,
+            'episode_rating_std': std,
+            'episode_rating_trend': trend,
+            'season_rating_std': season_rating_std,
+        }, index=pd.Index(store.show_ids[first:last], name='id')))
+
+    if not parts:
+        return pd.DataFrame(columns=SHOW_METRIC_COLUMNS, index=pd.Index([], name='id'))
+
+    metrics = pd.concat(parts)
+    metrics['episode_consistency'] = np.clip(1.0 - metrics['season_rating_std'] / CONSISTENCY_SCALE, 0.0, 1.0)
+    return metrics[SHOW_METRIC_COLUMNS]
+
+
+def season_metrics(store, show_id=None):
+    """Per-season episode count, mean, std and trend.
+
+    Pass show_id to read only that show's rows.
+    """
+    if show_id is not None:
+        ranges = [store.show_rows(show_id)]
+    else:
+        ranges = [(int(store.offsets[first]), int(store.offsets[last])) for first, last in store.blocks()]
+
+    parts = []
+    for start, stop in ranges:
+        if stop <= start:
+            continue
+        rating = np.asarray(store.rating[start:stop], dtype=np.float64)
+        season_starts = _season_starts(store, start, stop)
+        counts, mean, std, trend = _segment_stats(rating, season_starts)
+        parts.append(pd.DataFrame({
+            'id': store.show_id[start:stop][season_starts],
+            'season': store.season[start:stop][season_starts],
+            'episodes': counts,
+            'rating_mean': mean,
+            'rating_std': std,
+            'rating_trend': trend,
+        }))
+
+    if not parts:
+        return pd.DataFrame(columns=['id', 'season', 'episodes', 'rating_mean', 'rating_std', 'rating_trend'])
+    return pd.concat(parts, ignore_index=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the episode ratings store from a CSV")
+    parser.add_argument('csv', help="CSV with show_id, season, episode, rating and votes columns")
+    parser.add_argument('--out-dir', default=EPISODES_PATH)
+    args = parser.parse_args()
+
+    episodes = pd.read_csv(args.csv, usecols=list(EPISODE_COLUMNS))
+    write_store(episodes, args.out_dir)
+    print(f"Wrote {len(EpisodeStore(args.out_dir)):,} episodes to {args.out_dir}")
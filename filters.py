@@ -0,0 +1,92 @@
+from collections import namedtuple
+
+# Normalized sidebar filter state. Hashable, so it can key caches: search is
+# lowercased (it is matched as a case-insensitive literal substring), genres
+# are sorted, and a season range covering the whole dataset is stored as None.
+FilterState = namedtuple(
+    'FilterState',
+    ['search', 'top_n', 'score_range', 'genres', 'season_range', 'reddit']
+)
+
+DEFAULT_FILTER_STATE = FilterState(
+    search='',
+    top_n='All Shows',
+    score_range=(0, 100),
+    genres=(),
+    season_range=None,
+    reddit='All Shows',
+)
+
+# Number of filtered rankings (and their figures) kept in memory before the
+# least recently used one is evicted
+FILTER_CACHE_SIZE = 64
+
+
+def filter_state(search_query, top_n_filter, score_range, selected_genres,
+                 season_range, reddit_filter, season_bounds):
+    """Normalize raw sidebar values into a FilterState."""
+    season_range = tuple(int(s) for s in season_range)
+    return FilterState(
+        search=search_query.lower(),
+        top_n=top_n_filter,
+        score_range=tuple(int(s) for s in score_range),
+        genres=tuple(sorted(selected_genres)),
+        season_range=None if season_range == tuple(season_bounds) else season_range,
+        reddit=reddit_filter,
+    )
+
+
+def parse_filter_state(fields):
+    """Rebuild a FilterState from its _asdict() form after a JSON round trip."""
+    return FilterState(
+        search=fields['search'],
+        top_n=fields['top_n'],
+        score_range=tuple(fields['score_range']),
+        genres=tuple(fields['genres']),
+        season_range=None if fields['season_range'] is None else tuple(fields['season_range']),
+        reddit=fields['reddit'],
+    )
+
+
+def apply_filters(ranked_df, state):
+    """Filter a ranking (sorted by score, descending) down to the sidebar selection."""
+    if state == DEFAULT_FILTER_STATE:
+        return ranked_df
+
+    filtered_df = ranked_df
+
+    # Apply search filter
+    if state.search:
+        filtered_df = filtered_df[filtered_df['name'].str.contains(state.search, case=False, regex=False, na=False)]
+
+    # Apply other filters
+    mask = (
+        (filtered_df['background_score_100'] >= state.score_range[0]) &
+        (filtered_df['background_score_100'] <= state.score_range[1])
+    )
+    if state.season_range is not None:
+        mask &= (
+            (filtered_df['num_seasons'] >= state.season_range[0]) &
+            (filtered_df['num_seasons'] <= state.season_range[1])
+        )
+    filtered_df = filtered_df[mask]
+
+    # Genre filter
+    if state.genres:
+        # astype(bool) keeps an empty result a row mask rather than a column selection
+        filtered_df = filtered_df[filtered_df['genres'].apply(
+            lambda x: any(genre in x for genre in state.genres)
+        ).astype(bool)]
+
+    # Reddit data filter
+    if state.reddit == "With Reddit Data":
+        filtered_df = filtered_df[filtered_df['has_reddit_data'] == True]
+    elif state.reddit == "Without Reddit Data":
+        filtered_df = filtered_df[filtered_df['has_reddit_data'] == False]
+
+    # Apply Top N filter
+    if state.top_n != "All Shows":
+        n = int(state.top_n.split()[1])
+        filtered_df = filtered_df.head(n)
+
+    return filtered_df
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from scoring import (
+    COMPONENT_COLUMNS, DEFAULT_WEIGHTS, NEUTRAL_COMPONENT_SCORE, component_matrix, optional_components
+)
+
+# Local profile store
+PROFILES_PATH = 'data/profiles.json'
+
+DEFAULT_PROFILE_NAME = 'Default'
+DEFAULT_PROFILE = {
+    'weights': dict(zip(COMPONENT_COLUMNS, DEFAULT_WEIGHTS.tolist())),
+    'genre_boosts': {},
+    'season_preference': 'any',
+}
+
+# Preferred season-count ranges (inclusive) and the bonus for shows inside them
+SEASON_PREFERENCES = {
+    'any': None,
+    'short': (1, 3),
+    'medium': (4, 7),
+    'long': (8, None),
+}
+SEASON_PREFERENCE_LABELS = {
+    'any': 'No Preference',
+    'short': 'Short (1-3 seasons)',
+    'medium': 'Medium (4-7 seasons)',
+    'long': 'Long (8+ seasons)',
+}
+SEASON_BONUS = 0.05
+
+# Columns rank_shows adds to the dataset
+PROFILE_COLUMNS = ['profile_score_100', 'profile_rank']
+
+# Number of personalized rankings kept in memory before the least recently
+# used one is evicted
+PROFILE_CACHE_SIZE = 32
+
+
+def load_profiles(path=PROFILES_PATH):
+    """Load saved profiles, always including the built-in default."""
+    profiles = {DEFAULT_PROFILE_NAME: DEFAULT_PROFILE}
+    if os.path.exists(path):
+        with open(path) as f:
+            profiles.update(json.load(f))
+    return profiles
+
+
+def save_profile(name, profile, path=PROFILES_PATH):
+    """Create or overwrite a named profile in the local store."""
+    if name == DEFAULT_PROFILE_NAME:
+        raise ValueError(f"The '{DEFAULT_PROFILE_NAME}' profile cannot be modified")
+    stored = load_profiles(path)
+    stored.pop(DEFAULT_PROFILE_NAME)
+    stored[name] = profile
+    with open(path, 'w') as f:
+        json.dump(stored, f, indent=2, sort_keys=True)
+
+
+def delete_profile(name, path=PROFILES_PATH):
+    """Remove a named profile from the local store."""
+    stored = load_profiles(path)
+    stored.pop(DEFAULT_PROFILE_NAME)
+    stored.pop(name, None)
+    with open(path, 'w') as f:
+        json.dump(stored, f, indent=2, sort_keys=True)
+
+
+def profile_key(profile):
+    """Canonical JSON for a profile, used as its cache key."""
+    return json.dumps(profile, sort_keys=True)
+
+
+def dataset_fingerprint(df):
+    """Hash of the whole dataset: column names, every value and row order.
+
+    Rankings, filtered views and the snapshot all carry columns beyond the
+    scores, so any change to the data has to produce a new key.
+    """
+    hashable = df.assign(genres=df['genres'].apply('|'.join))
+    digest = hashlib.sha1(pd.util.hash_pandas_object(hashable, index=True).to_numpy().tobytes())
+    digest.update('\0'.join(hashable.columns).encode())
+    return f"{len(df)}-{digest.hexdigest()[:16]}"
+
+
+def profile_scores(df, profile):
+    """Personalized 0-1 score for every show under a profile.
+
+    Component weights, including any optional components present in df, are
+    renormalized to sum to one. Genre adjustments are added once per matching
+    genre, and shows inside the preferred season range get SEASON_BONUS, so
+    scores can fall outside 0-1; rank_shows clips them only for display.
+    """
+    optional = [column for column, _ in optional_components(df)]
+    weights = np.array([profile['weights'].get(c, 0.0) for c in COMPONENT_COLUMNS + optional])
+    if weights.sum() <= 0:
+        weights = np.append(DEFAULT_WEIGHTS, np.zeros(len(optional)))
+    weights = weights / weights.sum()
+
+    components = component_matrix(df, dtype=np.float64)
+    if optional:
+        components = np.column_stack([
+            components,
+            df[optional].fillna(NEUTRAL_COMPONENT_SCORE).to_numpy(dtype=np.float64)
+        ])
+    scores = components @ weights
+
+    if profile['genre_boosts']:
+        exploded = df['genres'].explode()
+        adjustment = exploded.map(profile['genre_boosts']).fillna(0.0)
+        scores = scores + adjustment.groupby(level=0).sum().reindex(df.index, fill_value=0.0).to_numpy()
+
+    season_range = SEASON_PREFERENCES[profile['season_preference']]
+    if season_range is not None:
+        low, high = season_range
+        in_range = df['num_seasons'] >= low
+        if high is not None:
+            in_range &= df['num_seasons'] <= high
+        scores = scores + SEASON_BONUS * in_range.to_numpy()
+
+    return scores
+
+
+def rank_shows(df, profile):
+    """Return df sorted by personalized score, with profile score and rank columns.
+
+    Shows are ordered by the unclipped score, so boosted shows above 1.0 keep
+    their relative order; the displayed profile_score_100 is clipped to 0-100.
+    """
+    scores = profile_scores(df, profile)
+    order = np.argsort(-scores, kind='stable')
+    ranked = df.iloc[order].assign(profile_score_100=np.clip(scores[order], 0.0, 1.0) * 100)
+    ranked['profile_rank'] = np.arange(1, len(ranked) + 1)
+    return ranked
@@ -0,0 +1,219 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Component columns and their default weights in the background score
+COMPONENT_COLUMNS = [
+    'genre_score',
+    'description_score',
+    'episodic_score',
+    'popularity_score',
+    'reddit_score_normalized',
+]
+COMPONENT_LABELS = ['Genre', 'Description', 'Episodic', 'Popularity', 'Reddit']
+DEFAULT_WEIGHTS = np.array([0.30, 0.25, 0.20, 0.15, 0.10])
+
+# Components outside the published score that profiles may weight when the
+# dataset provides them; shows without data get NEUTRAL_COMPONENT_SCORE
+OPTIONAL_COMPONENT_COLUMNS = ['episode_consistency']
+OPTIONAL_COMPONENT_LABELS = ['Episode Consistency']
+NEUTRAL_COMPONENT_SCORE = 0.5
+
+# Top-N cutoffs reported by the rank-stability analysis
+TOP_N_CUTOFFS = (5, 10, 25, 50, 100)
+
+# Upper bound on rank histogram bins per show; smaller datasets get exact ranks
+MAX_RANK_BINS = 250
+
+# Approximate memory budget for one chunk of sampled scores (bytes)
+CHUNK_MEMORY_BYTES = 64 * 1024 * 1024
+
+# Shows per histogram update block, sized so the block stays in cache
+HISTOGRAM_BLOCK = 2048
+
+# Below this many show-samples the pool start-up costs more than it saves
+PARALLEL_THRESHOLD = 5_000_000
+
+
+def component_matrix(df, dtype=np.float32):
+    """Return the (shows x components) score matrix.
+
+    The Reddit component is scaled by reddit_confidence, matching how it
+    enters final_background_score for shows without Reddit data.
+    """
+    components = df[COMPONENT_COLUMNS].to_numpy(dtype=dtype, copy=True)
+    components[:, -1] *= df['reddit_confidence'].to_numpy(dtype=dtype)
+    return components
+
+
+def optional_components(df):
+    """(column, label) pairs of the optional components present in df."""
+    return [
+        (column, label)
+        for column, label in zip(OPTIONAL_COMPONENT_COLUMNS, OPTIONAL_COMPONENT_LABELS)
+        if column in df.columns
+    ]
+
+
+def sample_weights(n_samples, concentration=100.0, seed=0):
+    """Sample weight vectors from a Dirichlet centred on the default weights.
+
+    Higher concentration keeps samples closer to DEFAULT_WEIGHTS.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.dirichlet(DEFAULT_WEIGHTS * concentration, size=n_samples).astype(np.float32)
+
+
+def _accumulate_chunk(components, weights, bin_width, cutoffs, totals):
+    """Rank every show under one chunk of weight samples and add to totals."""
+    hist, rank_sum, rank_sq_sum, top_counts = totals
+    n_samples = weights.shape[0]
+    n_shows, n_bins = hist.shape
+
+    # (samples x shows) so each row is sorted contiguously
+    order = np.argsort(-(weights @ components.T), axis=1)
+
+    # 0-based rank of every show in every sample
+    ranks = np.empty((n_samples, n_shows), dtype=np.int32)
+    ranks[np.arange(n_samples)[:, None], order] = np.arange(n_shows, dtype=np.int32)
+    del order
+
+    rank_sum += ranks.sum(axis=0, dtype=np.float64)
+    rank_sq_sum += np.square(ranks, dtype=np.float64).sum(axis=0)
+    for i, n in enumerate(cutoffs):
+        top_counts[:, i] += (ranks < n).sum(axis=0)
+
+    # Fill the histogram a block of shows at a time to keep the updates in cache
+    for start in range(0, n_shows, HISTOGRAM_BLOCK):
+        stop = min(n_shows, start + HISTOGRAM_BLOCK)
+        flat_index = ranks[:, start:stop] // bin_width
+        flat_index += np.arange(stop - start, dtype=np.int32) * n_bins
+        hist[start:stop] += np.bincount(
+            flat_index.ravel(), minlength=(stop - start) * n_bins
+        ).reshape(stop - start, n_bins)
+
+
+def _rank_stats(components, weights, bin_width, n_bins, cutoffs):
+    """Accumulate rank statistics over weights in memory-bounded chunks."""
+    n_shows = components.shape[0]
+    # Counts are at most the number of samples, so int32 halves the histogram
+    totals = (
+        np.zeros((n_shows, n_bins), dtype=np.int32),
+        np.zeros(n_shows),
+        np.zeros(n_shows),
+        np.zeros((n_shows, len(cutoffs)), dtype=np.int32),
+    )
+
+    # Scores, sort order and ranks peak at ~16 bytes per show-sample
+    chunk_size = max(1, CHUNK_MEMORY_BYTES // (n_shows * 16))
+    for start in range(0, len(weights), chunk_size):
+        _accumulate_chunk(components, weights[start:start + chunk_size], bin_width, cutoffs, totals)
+
+    return totals
+
+
+# Per-process copy of the component matrix so it is only pickled once per worker
+_worker_components = None
+
+
+def _init_worker(components):
+    global _worker_components
+    _worker_components = components
+
+
+def _worker_rank_stats(args):
+    weights, bin_width, n_bins, cutoffs = args
+    return _rank_stats(_worker_components, weights, bin_width, n_bins, cutoffs)
+
+
+def _histogram_quantile(hist, q, bin_width, n_shows):
+    """Rank (1-based) at quantile q of each show's rank histogram."""
+    cumulative = np.cumsum(hist, axis=1)
+    target = q * cumulative[:, -1:]
+    bin_index = (cumulative < target).sum(axis=1)
+    if q < 0.5:
+        rank = bin_index * bin_width + 1
+    else:
+        rank = np.minimum((bin_index + 1) * bin_width, n_shows)
+    return rank.astype(int)
+
+
+def rank_stability(df, n_samples=10_000, concentration=100.0, seed=0,
+                   ci=0.90, cutoffs=TOP_N_CUTOFFS, max_workers=None):
+    """Monte Carlo rank distribution of every show under perturbed weights.
+
+    Weight vectors are drawn from a Dirichlet around DEFAULT_WEIGHTS and every
+    show is rescored per sample as one matrix product. Samples are processed in
+    chunks sized to CHUNK_MEMORY_BYTES, split across a process pool for large
+    inputs, and ranks are accumulated into per-show histograms, so memory is
+    bounded by shows x MAX_RANK_BINS rather than shows x samples.
+
+    Returns a DataFrame indexed like df with the default rank, mean rank, rank
+    spread, the ci rank interval and P(Top N) columns, and the binned rank
+    histogram as one (shows x bins) int32 array in df's row order. The bin
+    width is ceil(len(df) / bins).
+    """
+    components = component_matrix(df)
+    n_shows = components.shape[0]
+    cutoffs = tuple(n for n in cutoffs if n <= n_shows)
+
+    bin_width = -(-n_shows // min(n_shows, MAX_RANK_BINS))
+    n_bins = -(-n_shows // bin_width)
+
+    weights = sample_weights(n_samples, concentration, seed)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if n_shows * n_samples < PARALLEL_THRESHOLD:
+        max_workers = 1
+    max_workers = min(max_workers, n_samples)
+
+    if max_workers == 1:
+        hist, rank_sum, rank_sq_sum, top_counts = _rank_stats(
+            components, weights, bin_width, n_bins, cutoffs
+        )
+    else:
+        # One contiguous share of samples per worker, so each returns a single
+        # set of totals instead of one histogram per chunk
+        shares = np.array_split(weights, max_workers)
+        # Forking the multi-threaded Streamlit server can deadlock a worker
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(components,)
+        ) as pool:
+            # Add each worker's totals in as it arrives rather than holding them all
+            parts = pool.map(
+                _worker_rank_stats,
+                [(share, bin_width, n_bins, cutoffs) for share in shares]
+            )
+            totals = next(parts)
+            for part in parts:
+                for total, value in zip(totals, part):
+                    total += value
+        hist, rank_sum, rank_sq_sum, top_counts = totals
+
+    mean_rank = rank_sum / n_samples
+    rank_std = np.sqrt(np.maximum(rank_sq_sum / n_samples - mean_rank ** 2, 0.0))
+
+    default_scores = components @ DEFAULT_WEIGHTS.astype(np.float32)
+    default_rank = np.empty(n_shows, dtype=int)
+    default_rank[np.argsort(-default_scores)] = np.arange(1, n_shows + 1)
+
+    tail = (1.0 - ci) / 2.0
+    result = pd.DataFrame({
+        'default_rank': default_rank,
+        'mean_rank': mean_rank + 1,
+        'rank_std': rank_std,
+        'rank_ci_low': _histogram_quantile(hist, tail, bin_width, n_shows),
+        'rank_ci_high': _histogram_quantile(hist, 1.0 - tail, bin_width, n_shows),
+    }, index=df.index)
+    for i, n in enumerate(cutoffs):
+        result[f'p_top_{n}'] = top_counts[:, i] / n_samples
+
+    return result, hist
@@ -0,0 +1,231 @@
+"""Pre-render the default dashboard view to static HTML/JSON artifacts.
+
+Run ``python snapshot.py`` after the dataset changes. The dashboard serves
+these artifacts while the sidebar is in its default state and falls back to
+live computation as soon as a filter changes.
+"""
+import argparse
+import html
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from dataset import read_shows
+from profiles import DEFAULT_PROFILE, dataset_fingerprint, rank_shows
+import views
+
+SNAPSHOT_DIR = 'data/snapshot'
+MANIFEST_FILE = 'manifest.json'
+
+# Bump whenever the snapshot layout or any figure in views.py changes, so
+# snapshots built by older code are treated as stale
+SNAPSHOT_VERSION = 3
+
+# Tab 2 figures, in display order
+SNAPSHOT_FIGURES = ['histogram', 'scatter', 'heatmap', 'genre', 'genre_cooccurrence']
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
+<style>
+    body {{ font-family: 'Inter', sans-serif; background-color: #f8f8f8; color: #333333; margin: 2rem; }}
+    h1, h2 {{ color: #333333; }}
+    strong {{ color: #610099; }}
+    table {{ border-collapse: collapse; background-color: #ffffff; }}
+    th, td {{ border: 1px solid #e5e5e5; padding: 0.4rem 0.8rem; text-align: left; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+# Per-process dataset copies so they are only pickled once per worker
+_worker_df = None
+_worker_ranked = None
+
+
+def _init_worker(df, ranked):
+    global _worker_df, _worker_ranked
+    _worker_df = df
+    _worker_ranked = ranked
+
+
+def _build_figure(name):
+    if name == 'histogram':
+        return views.score_histogram(_worker_ranked)
+    if name == 'scatter':
+        return views.score_scatter(_worker_ranked)
+    if name == 'heatmap':
+        return views.component_heatmap(_worker_ranked)
+    if name == 'genre':
+        return views.genre_bar(views.genre_analytics(_worker_ranked)[0])
+    if name == 'genre_cooccurrence':
+        return views.genre_cooccurrence(views.genre_analytics(_worker_ranked)[1])
+    raise ValueError(f"Unknown snapshot figure: {name}")
+
+
+def _write_figure_json(fig, path):
+    """Write a figure without its template so the app applies its own theme on load."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(fig)
+    fig.layout.template = None
+    with open(path, 'w') as f:
+        f.write(fig.to_json())
+
+
+def _render_figure(args):
+    """Write one Tab 2 figure as JSON and return its HTML fragment."""
+    name, out_dir = args
+    fig = _build_figure(name)
+    relpath = os.path.join('figures', f'{name}.json')
+    _write_figure_json(fig, os.path.join(out_dir, relpath))
+    return name, relpath, fig.to_html(full_html=False, include_plotlyjs=False)
+
+
+def _render_show(args):
+    """Write one show's radar chart JSON and static detail page."""
+    index, out_dir = args
+    show = _worker_df.loc[index]
+    fig = views.component_radar(show)
+
+    relpath = os.path.join('shows', f"{show['id']}.json")
+    _write_figure_json(fig, os.path.join(out_dir, relpath))
+
+    body = f"""
+<h1>{html.escape(show['name'])}</h1>
+<p><strong>Background Score:</strong> {show['background_score_100']:.1f}
+ | <strong>IMDb Rating:</strong> {show['vote_average']:.1f}/10
+ | <strong>Seasons:</strong> {int(show['num_seasons'])}
+ | <strong>Episodes:</strong> {int(show['num_episodes'])}</p>
+<p>{html.escape(str(show['overview']))}</p>
+<p><strong>Genres:</strong> {html.escape(', '.join(show['genres']))}
+ | <strong>First Aired:</strong> {show['first_air_date']}
+ | <strong>Status:</strong> {show['status']}</p>
+<h2>Component Scores</h2>
+{fig.to_html(full_html=False, include_plotlyjs=False)}
+"""
+    with open(os.path.join(out_dir, 'shows', f"{show['id']}.html"), 'w') as f:
+        f.write(PAGE_TEMPLATE.format(title=html.escape(show['name']), body=body))
+
+    return int(show['id']), relpath
+
+
+def build_snapshot(out_dir=SNAPSHOT_DIR, max_workers=None):
+    """Render the default view and every show's detail page into out_dir.
+
+    Figures and show pages are rendered across a process pool. The manifest is
+    written last, so a partially built snapshot is never served.
+    """
+    df = read_shows()
+    ranked = rank_shows(df, DEFAULT_PROFILE)
+
+    os.makedirs(os.path.join(out_dir, 'figures'), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, 'shows'), exist_ok=True)
+
+    # Default Rankings tab: background score, descending
+    table = views.rankings_table(ranked)
+    table.to_json(os.path.join(out_dir, 'rankings.json'), orient='split')
+    with open(os.path.join(out_dir, 'rankings.csv'), 'w') as f:
+        f.write(views.rankings_csv(ranked))
+    with open(os.path.join(out_dir, 'summary.json'), 'w') as f:
+        json.dump(views.rankings_summary(ranked), f)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(df, ranked)
+    ) as pool:
+        figure_results = pool.map(_render_figure, [(name, out_dir) for name in SNAPSHOT_FIGURES])
+        show_results = pool.map(
+            _render_show,
+            [(index, out_dir) for index in df.index],
+            chunksize=max(1, len(df) // (4 * (max_workers or os.cpu_count() or 1)))
+        )
+        figures = {}
+        fragments = []
+        for name, relpath, fragment in figure_results:
+            figures[name] = relpath
+            fragments.append(fragment)
+        shows = dict(show_results)
+
+    body = "<h1>TV Background Analyzer</h1>\n<h2>Data Visualizations</h2>\n"
+    body += "\n".join(fragments)
+    body += "\n<h2>Show Rankings</h2>\n" + table.to_html(index=False)
+    with open(os.path.join(out_dir, 'index.html'), 'w') as f:
+        f.write(PAGE_TEMPLATE.format(title="TV Background Analyzer", body=body))
+
+    manifest = {
+        'version': SNAPSHOT_VERSION,
+        'dataset_key': dataset_fingerprint(df),
+        'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'figures': figures,
+        'shows': {str(show_id): relpath for show_id, relpath in shows.items()},
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def read_snapshot(dataset_key, out_dir=SNAPSHOT_DIR):
+    """Load the snapshot tables, or None if it is missing or stale.
+
+    A snapshot is stale if it was built from another dataset or by another
+    SNAPSHOT_VERSION, or if any figure is missing.
+    """
+    manifest_path = os.path.join(out_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != SNAPSHOT_VERSION or manifest['dataset_key'] != dataset_key:
+        return None
+    figures = {name: os.path.join(out_dir, p) for name, p in manifest['figures'].items()}
+    if any(name not in figures or not os.path.exists(figures[name]) for name in SNAPSHOT_FIGURES):
+        return None
+
+    with open(os.path.join(out_dir, 'rankings.json')) as f:
+        table = pd.read_json(io.StringIO(f.read()), orient='split', precise_float=True)
+    with open(os.path.join(out_dir, 'summary.json')) as f:
+        summary = json.load(f)
+    with open(os.path.join(out_dir, 'rankings.csv')) as f:
+        csv = f.read()
+
+    return {
+        'manifest': manifest,
+        'table': table,
+        'summary': summary,
+        'csv': csv,
+        'figures': figures,
+        'shows': {int(k): os.path.join(out_dir, p) for k, p in manifest['shows'].items()},
+    }
+
+
+def read_figure(path):
+    """Load a pre-rendered figure."""
+    import plotly.io as pio
+
+    with open(path) as f:
+        return pio.from_json(f.read())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out-dir', default=SNAPSHOT_DIR)
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = build_snapshot(args.out_dir, args.workers)
+    print(f"Rendered {len(manifest['figures'])} figures and {len(manifest['shows'])} show pages "
+          f"to {args.out_dir} in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,137 @@
+"""Cold-start profiling for the dashboard.
+
+The dashboard times the phases of each script run; the first run in a server
+process is printed to stderr as the startup-time report. Streamlit runs the
+script when the first session connects, so that run's duration is the time
+to first render. Run ``python startup.py`` for a per-module import-time
+breakdown measured in a fresh interpreter.
+"""
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Modules the dashboard imports up front, in import order
+APP_MODULES = ['streamlit', 'dataset', 'scoring', 'episodes', 'profiles', 'snapshot', 'filters', 'access_log', 'views']
+
+# Imported on first use (or by the background warmer) instead of at startup
+DEFERRED_MODULES = ['plotly.express', 'plotly.graph_objects', 'plotly.io']
+
+_report_lock = threading.Lock()
+_reported = False
+
+
+def process_age():
+    """Seconds since this process started, or None where /proc is unavailable."""
+    try:
+        with open('/proc/self/stat') as f:
+            # Fields after the parenthesised command name; starttime is field 22
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def import_deferred():
+    """Import DEFERRED_MODULES now rather than when a figure is first built."""
+    for name in DEFERRED_MODULES:
+        importlib.import_module(name)
+
+
+class RunTimer:
+    """Phase timings for one script run.
+
+    Create it before the script's imports and call mark() at the end of each
+    phase. finish() prints the report for the first run in the process only.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []
+
+    def mark(self, phase):
+        self.marks.append((phase, time.perf_counter() - self.start))
+
+    def report(self):
+        """Phase durations, total run time and modules still deferred."""
+        phases = []
+        previous = 0.0
+        for phase, elapsed in self.marks:
+            phases.append((phase, elapsed - previous))
+            previous = elapsed
+        return {
+            'phases': phases,
+            'run_seconds': previous,
+            'process_age': process_age(),
+            'deferred': [name for name in DEFERRED_MODULES if name not in sys.modules],
+        }
+
+    def finish(self):
+        global _reported
+        with _report_lock:
+            if _reported:
+                return
+            _reported = True
+        print(format_report(self.report()), file=sys.stderr, flush=True)
+
+
+def format_report(report):
+    lines = ["Startup report (first script run in this process)"]
+    lines.append(f"  {'time to first render':<24}{report['run_seconds']:8.2f}s")
+    for phase, seconds in report['phases']:
+        lines.append(f"    {phase:<22}{seconds:8.2f}s")
+    if report['process_age'] is not None:
+        # Includes however long the process sat idle before its first session
+        lines.append(f"  {'process age':<24}{report['process_age']:8.2f}s at first render, including idle time")
+    if report['deferred']:
+        lines.append(f"  deferred until first use: {', '.join(report['deferred'])}")
+    return "\n".join(lines)
+
+
+def import_times(modules):
+    """Cumulative import time in seconds of each module, imported in order.
+
+    Measured with ``python -X importtime`` in a fresh interpreter, so each
+    module is charged for the dependencies it is first to import; a module
+    already pulled in by an earlier one costs 0.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', '; '.join(f'import {m}' for m in modules)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Top-level imports are indented by a single space
+        if name.strip() in modules and len(name) - len(name.lstrip()) == 1:
+            times[name.strip()] = int(cumulative) / 1e6
+
+    return [(module, times.get(module, 0.0)) for module in modules]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Import-time breakdown of the dashboard's modules")
+    parser.parse_args()
+
+    breakdown = import_times(APP_MODULES + DEFERRED_MODULES)
+    eager = breakdown[:len(APP_MODULES)]
+    deferred = breakdown[len(APP_MODULES):]
+
+    print("Imported at startup:")
+    for module, seconds in eager:
+        print(f"  {module:<24}{seconds * 1000:8.1f} ms")
+    print(f"  {'total':<24}{sum(s for _, s in eager) * 1000:8.1f} ms")
+    print("Deferred until first use:")
+    for module, seconds in deferred:
+        print(f"  {module:<24}{seconds * 1000:8.1f} ms")
@@ -0,0 +1,42 @@
+import json
+
+from access_log import compact_access_log, hot_filter_states, record_filter_state
+from filters import DEFAULT_FILTER_STATE
+
+
+def read_lines(path):
+    with open(path) as f:
+        return f.readlines()
+
+
+def test_hot_states_are_most_frequent_first(tmp_path):
+    path = str(tmp_path / 'access_log.jsonl')
+    office = DEFAULT_FILTER_STATE._replace(search='office')
+    for state in [office, DEFAULT_FILTER_STATE, office]:
+        record_filter_state(state, path)
+    with open(path, 'a') as f:
+        f.write('{"time": "2026-10-19T00:00:00", "filt\n')
+
+    assert hot_filter_states(k=2, path=path) == [office, DEFAULT_FILTER_STATE]
+
+
+def test_log_is_compacted_to_window(tmp_path):
+    path = str(tmp_path / 'access_log.jsonl')
+    for i in range(10):
+        record_filter_state(DEFAULT_FILTER_STATE._replace(search=str(i)), path)
+    compact_access_log(path, window=5)
+    assert len(read_lines(path)) == 10
+
+    record_filter_state(DEFAULT_FILTER_STATE._replace(search='10'), path)
+    compact_access_log(path, window=5)
+    searches = [json.loads(line)['filters']['search'] for line in read_lines(path)]
+    assert searches == ['6', '7', '8', '9', '10']
+
+
+def test_recording_bounds_log_size(tmp_path):
+    path = str(tmp_path / 'access_log.jsonl')
+    for i in range(100):
+        record_filter_state(DEFAULT_FILTER_STATE._replace(search=str(i)), path, window=5)
+
+    # Checked every window appends, so at most 2 * window + window - 1 lines
+    assert len(read_lines(path)) < 3 * 5
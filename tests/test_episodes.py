@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import episodes
+from episodes import EpisodeStore, season_metrics, show_metrics, write_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Shows of one episode, one season and several seasons, stored out of order."""
+    rng = np.random.default_rng(0)
+    rows = []
+    for show_id, seasons in [(7, [1]), (3, [4]), (12, [10, 8, 12]), (5, [2, 1]), (9, [6, 6, 6, 6])]:
+        for season, n_episodes in enumerate(seasons, start=1):
+            for episode in range(1, n_episodes + 1):
+                rows.append((show_id, season, episode, rng.uniform(5, 10), rng.integers(10, 1000)))
+    df = pd.DataFrame(rows, columns=['show_id', 'season', 'episode', 'rating', 'votes'])
+    df.loc[4, 'rating'] = np.nan
+    write_store(df.sample(frac=1, random_state=0), str(tmp_path))
+    return EpisodeStore(str(tmp_path)), df.dropna(subset=['rating'])
+
+
+def trend(ratings):
+    if len(ratings) < 2:
+        return 0.0
+    return np.polyfit(np.arange(len(ratings)), ratings.to_numpy(dtype=np.float32), 1)[0]
+
+
+def expected_seasons(df):
+    df = df.sort_values(['show_id', 'season', 'episode'])
+    rating = df['rating'].astype(np.float32).astype(np.float64)
+    grouped = rating.groupby([df['show_id'], df['season']])
+    return pd.DataFrame({
+        'episodes': grouped.count(),
+        'rating_mean': grouped.mean(),
+        'rating_std': grouped.std(ddof=0),
+        'rating_trend': grouped.apply(trend),
+    })
+
+
+# 1 row per block puts each show in its own block; 5 and 10 group small shows together
+@pytest.mark.parametrize('block_rows', [1, 5, 10, 1 << 20])
+def test_show_metrics_match_groupby(store, monkeypatch, block_rows):
+    monkeypatch.setattr(episodes, 'BLOCK_ROWS', block_rows)
+    store, df = store
+    metrics = show_metrics(store)
+
+    df = df.sort_values(['show_id', 'season', 'episode'])
+    rating = df['rating'].astype(np.float32).astype(np.float64)
+    grouped = rating.groupby(df['show_id'])
+    seasons = expected_seasons(df)
+    np.testing.assert_array_equal(metrics.index, sorted(df['show_id'].unique()))
+    np.testing.assert_array_equal(metrics['rated_episodes'], grouped.count())
+    np.testing.assert_array_equal(metrics['episode_votes'], df.groupby('show_id')['votes'].sum())
+    np.testing.assert_allclose(metrics['episode_rating_mean'], grouped.mean())
+    np.testing.assert_allclose(metrics['episode_rating_std'], grouped.std(ddof=0), atol=1e-12)
+    np.testing.assert_allclose(metrics['episode_rating_trend'], grouped.apply(trend), atol=1e-6)
+    np.testing.assert_allclose(
+        metrics['season_rating_std'], seasons['rating_std'].groupby(level='show_id').mean(), atol=1e-12
+    )
+
+
+@pytest.mark.parametrize('block_rows', [1, 5, 1 << 20])
+def test_season_metrics_match_groupby(store, monkeypatch, block_rows):
+    monkeypatch.setattr(episodes, 'BLOCK_ROWS', block_rows)
+    store, df = store
+    expected = expected_seasons(df)
+
+    metrics = season_metrics(store).set_index(['id', 'season'])
+    np.testing.assert_array_equal(metrics.index.to_frame().to_numpy(), expected.index.to_frame().to_numpy())
+    np.testing.assert_array_equal(metrics['episodes'], expected['episodes'])
+    np.testing.assert_allclose(metrics[['rating_mean', 'rating_std']], expected[['rating_mean', 'rating_std']], atol=1e-12)
+    np.testing.assert_allclose(metrics['rating_trend'], expected['rating_trend'], atol=1e-6)
+
+    one_show = season_metrics(store, show_id=12)
+    assert one_show['season'].tolist() == [1, 2, 3]
+    assert season_metrics(store, show_id=4).empty
+
+
+def test_consistency_ignores_drift_across_seasons(tmp_path):
+    # Flat within each season, one point higher every season
+    df = pd.DataFrame({
+        'show_id': 1,
+        'season': np.repeat([1, 2, 3], 4),
+        'episode': np.tile([1, 2, 3, 4], 3),
+        'rating': np.repeat([6.0, 7.0, 8.0], 4),
+        'votes': 100,
+    })
+    write_store(df, str(tmp_path))
+    metrics = show_metrics(EpisodeStore(str(tmp_path)))
+    assert metrics.loc[1, 'episode_rating_std'] > 0.5
+    assert metrics.loc[1, 'episode_consistency'] == 1.0
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from filters import DEFAULT_FILTER_STATE, apply_filters, filter_state
+
+
+def ranked_shows():
+    return pd.DataFrame({
+        'name': ['The Office', 'S.W.A.T.', 'Doctor Who (2005)'],
+        'background_score_100': [90.0, 50.0, 40.0],
+        'num_seasons': [9, 8, 13],
+        'genres': [['Comedy'], ['Crime'], ['Sci-Fi & Fantasy']],
+        'has_reddit_data': [True, False, True],
+    })
+
+
+def search(query):
+    state = filter_state(query, 'All Shows', (0, 100), [], (8, 13), 'All Shows', (8, 13))
+    return apply_filters(ranked_shows(), state)['name'].tolist()
+
+
+def test_search_is_case_insensitive():
+    assert search('the OFFICE') == ['The Office']
+
+
+def test_search_matches_literally():
+    assert search('S.W.A.T.') == ['S.W.A.T.']
+    assert search('(2005)') == ['Doctor Who (2005)']
+    assert search('\\S') == []
+
+
+def test_default_state_returns_input():
+    df = ranked_shows()
+    assert apply_filters(df, DEFAULT_FILTER_STATE) is df
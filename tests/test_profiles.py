@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from profiles import dataset_fingerprint
+
+
+@pytest.fixture
+def shows():
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'name': ['A', 'B', 'C'],
+        'vote_average': [7.5, 8.0, 6.5],
+        'background_score_100': [60.0, 70.0, 50.0],
+        'genres': [['Comedy'], ['Drama', 'Crime'], []],
+    })
+
+
+@pytest.mark.parametrize('column, value', [
+    ('name', 'Z'),
+    ('vote_average', 9.9),
+    ('background_score_100', 99.0),
+    ('genres', ['Comedy', 'Family']),
+])
+def test_fingerprint_changes_with_any_column(shows, column, value):
+    changed = shows.copy()
+    changed.at[0, column] = value
+    assert dataset_fingerprint(changed) != dataset_fingerprint(shows)
+
+
+def test_fingerprint_is_stable(shows):
+    assert dataset_fingerprint(shows.copy()) == dataset_fingerprint(shows)
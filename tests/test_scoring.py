@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profiles import DEFAULT_PROFILE, PROFILE_COLUMNS, profile_scores, rank_shows
+from scoring import COMPONENT_COLUMNS, DEFAULT_WEIGHTS, rank_stability
+from views import rankings_csv
+
+
+@pytest.fixture
+def shows():
+    """Shows built from a dict of arrays, so the component columns share one block."""
+    rng = np.random.default_rng(0)
+    n = 60
+    data = {column: rng.random(n) for column in COMPONENT_COLUMNS}
+    data['id'] = np.arange(n)
+    data['reddit_confidence'] = rng.choice([0.0, 0.5, 1.0], n)
+    data['num_seasons'] = rng.integers(1, 12, n)
+    df = pd.DataFrame(data)
+    df['genres'] = [['Comedy'] if i % 2 else ['Drama'] for i in range(n)]
+
+    reddit = df['reddit_score_normalized'] * df['reddit_confidence']
+    components = np.column_stack([df[COMPONENT_COLUMNS[:-1]].to_numpy(), reddit])
+    df['background_score_100'] = components @ DEFAULT_WEIGHTS * 100
+    return df
+
+
+def test_default_profile_matches_background_score(shows):
+    np.testing.assert_allclose(profile_scores(shows, DEFAULT_PROFILE) * 100, shows['background_score_100'])
+
+
+def test_rank_shows_does_not_modify_input(shows):
+    before = shows.copy()
+    ranked = rank_shows(shows, DEFAULT_PROFILE)
+    pd.testing.assert_frame_equal(shows, before)
+    assert ranked['profile_rank'].tolist() == list(range(1, len(shows) + 1))
+
+
+def test_boosted_shows_are_ranked_by_unclipped_score(shows):
+    profile = dict(DEFAULT_PROFILE, genre_boosts={'Comedy': 0.6}, season_preference='long')
+    scores = profile_scores(shows, profile)
+    ranked = rank_shows(shows, profile)
+
+    assert ranked['profile_score_100'].between(0, 100).all()
+    # Shows displayed at 100 are still ordered by their weighted score
+    top = ranked.index[ranked['profile_score_100'] == 100]
+    assert len(top) > 1
+    assert (np.diff(scores[top]) < 0).all()
+
+
+def test_export_has_profile_columns_only_when_personalized(shows):
+    ranked = rank_shows(shows, DEFAULT_PROFILE)
+    header = rankings_csv(ranked).splitlines()[0].split(',')
+    assert header == shows.columns.tolist()
+    assert rankings_csv(ranked, personalized=True).splitlines()[0].split(',')[-2:] == PROFILE_COLUMNS
+
+
+def test_rank_stability_default_rank_follows_background_score(shows):
+    result, hist = rank_stability(shows, n_samples=200, max_workers=1)
+    expected = shows['background_score_100'].rank(ascending=False, method='first').astype(int)
+    assert (result['default_rank'] == expected).all()
+    assert ((result['p_top_5'] >= 0) & (result['p_top_5'] <= 1)).all()
+    assert result['p_top_5'].sum() == pytest.approx(5)
+    assert hist.shape == (len(shows), len(shows)) and hist.dtype == np.int32
+    assert (hist.sum(axis=1) == 200).all()
@@ -0,0 +1,55 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from snapshot import MANIFEST_FILE, SNAPSHOT_FIGURES, SNAPSHOT_VERSION, read_snapshot
+
+
+def write_snapshot(out_dir, manifest):
+    os.makedirs(os.path.join(out_dir, 'figures'))
+    for name in manifest['figures']:
+        with open(os.path.join(out_dir, 'figures', f'{name}.json'), 'w') as f:
+            f.write('{}')
+    pd.DataFrame({'Show': ['A']}).to_json(os.path.join(out_dir, 'rankings.json'), orient='split')
+    with open(os.path.join(out_dir, 'summary.json'), 'w') as f:
+        json.dump({'total_shows': 1}, f)
+    with open(os.path.join(out_dir, 'rankings.csv'), 'w') as f:
+        f.write('name\nA\n')
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f)
+
+
+@pytest.fixture
+def manifest():
+    return {
+        'version': SNAPSHOT_VERSION,
+        'dataset_key': 'key',
+        'figures': {name: os.path.join('figures', f'{name}.json') for name in SNAPSHOT_FIGURES},
+        'shows': {},
+    }
+
+
+def test_current_snapshot_is_served(tmp_path, manifest):
+    write_snapshot(tmp_path, manifest)
+    snapshot = read_snapshot('key', tmp_path)
+    assert snapshot is not None
+    assert set(snapshot['figures']) == set(SNAPSHOT_FIGURES)
+
+
+def test_other_dataset_is_stale(tmp_path, manifest):
+    write_snapshot(tmp_path, manifest)
+    assert read_snapshot('other', tmp_path) is None
+
+
+def test_unversioned_snapshot_is_stale(tmp_path, manifest):
+    del manifest['version']
+    write_snapshot(tmp_path, manifest)
+    assert read_snapshot('key', tmp_path) is None
+
+
+def test_missing_figure_is_stale(tmp_path, manifest):
+    del manifest['figures']['genre_cooccurrence']
+    write_snapshot(tmp_path, manifest)
+    assert read_snapshot('key', tmp_path) is None
@@ -0,0 +1,343 @@
+import numpy as np
+import pandas as pd
+
+from profiles import PROFILE_COLUMNS
+from scoring import COMPONENT_COLUMNS, COMPONENT_LABELS
+
+# Tables and figures shared by the live dashboard and the static snapshot build.
+# Plotly is imported inside the figure functions so the tables (and a cold
+# start that only shows them) don't pay for it.
+
+
+def rankings_table(sorted_df):
+    """Format the Rankings tab table, keeping sorted_df's index."""
+    display_df = sorted_df[[
+        'name', 'background_score_100', 'vote_average', 'num_seasons',
+        'num_episodes', 'genres'
+    ]].copy()
+
+    # Rename columns for display
+    display_df.columns = [
+        'Show', 'Background Score', 'IMDb Rating', 'Seasons',
+        'Episodes', 'Genres'
+    ]
+
+    # Format scores
+    display_df['Background Score'] = display_df['Background Score'].round(1)
+    display_df['Genres'] = display_df['Genres'].apply(lambda x: ', '.join(x[:3]))
+
+    return display_df
+
+
+def rankings_summary(sorted_df):
+    """Quick stats shown above the rankings table."""
+    return {
+        'total_shows': len(sorted_df),
+        'average_score': float(sorted_df['background_score_100'].mean()),
+        'highest_rated': float(sorted_df['vote_average'].max()),
+        'total_episodes': int(sorted_df['num_episodes'].sum()),
+    }
+
+
+def rankings_csv(sorted_df, personalized=False):
+    """CSV export of the rankings; profile columns only for a personalized profile."""
+    if not personalized:
+        sorted_df = sorted_df.drop(columns=PROFILE_COLUMNS, errors='ignore')
+    return sorted_df.to_csv(index=False)
+
+
+def score_histogram(filtered_df):
+    import plotly.express as px
+
+    fig_hist = px.histogram(
+        filtered_df,
+        x='background_score_100',
+        nbins=30,
+        labels={'background_score_100': 'Background Score'},
+        color_discrete_sequence=['#610099']
+    )
+    fig_hist.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Background Score",
+        yaxis_title="Number of Shows",
+        showlegend=False,
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        xaxis=dict(gridcolor='#e5e5e5'),
+        yaxis=dict(gridcolor='#e5e5e5'),
+        margin=dict(t=20, b=0)
+    )
+    return fig_hist
+
+
+def score_scatter(filtered_df):
+    import plotly.express as px
+
+    fig_scatter = px.scatter(
+        filtered_df,
+        x='vote_average',
+        y='background_score_100',
+        hover_data=['name', 'num_seasons'],
+        labels={
+            'vote_average': 'IMDb Rating',
+            'background_score_100': 'Background Score',
+            'name': 'Show'
+        },
+        color='genre_score',
+        color_continuous_scale=['#e5e5e5', '#432656', '#640c9c'],
+        size='popularity',
+        size_max=15
+    )
+    fig_scatter.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="IMDb Rating",
+        yaxis_title="Background Score",
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        xaxis=dict(gridcolor='#e5e5e5'),
+        yaxis=dict(gridcolor='#e5e5e5'),
+        coloraxis_colorbar=dict(title="Genre Score"),
+        margin=dict(t=20, b=0)
+    )
+    return fig_scatter
+
+
+def component_heatmap(filtered_df):
+    """Component scores heatmap for the top 20 shows."""
+    import plotly.graph_objects as go
+
+    top_20 = filtered_df.nlargest(20, 'background_score_100')
+
+    heatmap_data = top_20[['name'] + COMPONENT_COLUMNS].copy()
+    heatmap_data.columns = ['Show'] + COMPONENT_LABELS
+    heatmap_data = heatmap_data.set_index('Show')
+
+    # Create discrete color scale with balanced steps
+    fig_heatmap = go.Figure(data=go.Heatmap(
+        z=heatmap_data.values.T,
+        x=heatmap_data.index,
+        y=heatmap_data.columns,
+        colorscale=[
+            [0.0, '#f5f5f5'],    # 0.0-0.2: Very low - lightest gray
+            [0.2, '#d9d9d9'],    # 0.2-0.4: Low - light gray
+            [0.4, '#c9b3e0'],    # 0.4-0.6: Medium - light purple
+            [0.6, '#a580cc'],    # 0.6-0.8: Medium-high - medium purple
+            [0.8, '#7a3db8'],    # 0.8-1.0: High - darker purple
+            [1.0, '#610099']     # 1.0: Highest - your accent purple
+        ],
+        zmid=0.5,
+        colorbar=dict(
+            title="Score",
+            tickmode='array',
+            tickvals=[0.1, 0.3, 0.5, 0.7, 0.9],
+            ticktext=['0.0-0.2', '0.2-0.4', '0.4-0.6', '0.6-0.8', '0.8-1.0'],
+            tickfont=dict(color="#333333")
+        )
+    ))
+
+    # Update text color based on background - white for darker, dark for lighter
+    annotations = []
+    for i, row in enumerate(heatmap_data.values.T):
+        for j, value in enumerate(row):
+            text_color = '#ffffff' if value > 0.6 else '#333333'
+            annotations.append(
+                dict(
+                    x=heatmap_data.index[j],
+                    y=heatmap_data.columns[i],
+                    text=f'{value:.2f}',
+                    showarrow=False,
+                    font=dict(color=text_color, size=10, family="Inter, sans-serif")
+                )
+            )
+
+    fig_heatmap.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="",
+        yaxis_title="",
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        height=400,
+        margin=dict(t=20, b=0),
+        annotations=annotations
+    )
+    return fig_heatmap
+
+
+def genre_analytics(filtered_df):
+    """Per-genre score stats and genre co-occurrence counts for a set of shows.
+
+    Genres are exploded once and aggregated in a single groupby, so the cost is
+    one pass over the (show, genre) pairs however many genres exist. Returns
+    (genre_stats, cooccurrence); the co-occurrence diagonal is each genre's
+    show count.
+    """
+    exploded = filtered_df[['genres', 'background_score_100']].explode('genres')
+    exploded = exploded.dropna(subset=['genres'])
+
+    genre_stats = exploded.groupby('genres')['background_score_100'].agg(['mean', 'median', 'count', 'std'])
+    genre_stats = genre_stats.fillna({'std': 0.0}).sort_values('mean', ascending=False)
+    genre_stats = genre_stats.rename_axis('Genre').reset_index()
+    genre_stats.columns = ['Genre', 'Avg Score', 'Median Score', 'Count', 'Score Spread']
+
+    # One-hot (show x genre) membership; its Gram matrix counts shared shows
+    genres = np.sort(genre_stats['Genre'].to_numpy())
+    genre_codes = pd.Index(genres).get_indexer(exploded['genres'])
+    show_codes, _ = pd.factorize(exploded.index)
+    membership = np.zeros((show_codes.max() + 1 if len(show_codes) else 0, len(genres)), dtype=np.int32)
+    membership[show_codes, genre_codes] = 1
+    cooccurrence = pd.DataFrame(membership.T @ membership, index=genres, columns=genres)
+
+    return genre_stats, cooccurrence
+
+
+def genre_bar(genre_df_plot):
+    import plotly.express as px
+
+    fig_genre = px.bar(
+        genre_df_plot,
+        x='Genre',
+        y='Avg Score',
+        hover_data=['Median Score', 'Score Spread', 'Count'],
+        labels={'Avg Score': 'Average Background Score'},
+        color='Avg Score',
+        color_continuous_scale=[[0, '#e5e5e5'], [0.5, '#8e52c7'], [1, '#610099']]
+    )
+    fig_genre.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Genre",
+        yaxis_title="Average Background Score",
+        xaxis_tickangle=-45,
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        xaxis=dict(gridcolor='#e5e5e5'),
+        yaxis=dict(gridcolor='#e5e5e5'),
+        showlegend=False,
+        margin=dict(t=20, b=0)
+    )
+    return fig_genre
+
+
+def genre_cooccurrence(cooccurrence):
+    """Heatmap of how many shows each pair of genres shares."""
+    import plotly.graph_objects as go
+
+    fig_cooccurrence = go.Figure(data=go.Heatmap(
+        z=cooccurrence.values,
+        x=cooccurrence.columns,
+        y=cooccurrence.index,
+        colorscale=[[0, '#f5f5f5'], [0.5, '#a580cc'], [1, '#610099']],
+        hovertemplate="%{y} + %{x}<br>%{z} shows<extra></extra>",
+        colorbar=dict(title="Shows", tickfont=dict(color="#333333"))
+    ))
+    fig_cooccurrence.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="",
+        yaxis_title="",
+        xaxis_tickangle=-45,
+        yaxis=dict(autorange='reversed'),
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        height=500,
+        margin=dict(t=20, b=0)
+    )
+    return fig_cooccurrence
+
+
+def component_radar(show_data):
+    """Radar chart of one show's component scores."""
+    import plotly.graph_objects as go
+
+    values = [show_data[column] for column in COMPONENT_COLUMNS]
+
+    fig_radar = go.Figure()
+    fig_radar.add_trace(go.Scatterpolar(
+        r=values,
+        theta=COMPONENT_LABELS,
+        fill='toself',
+        fillcolor='rgba(97, 0, 153, 0.3)',
+        line=dict(color='#610099', width=2),
+        name=show_data['name']
+    ))
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 1],
+                gridcolor='#e5e5e5',
+                tickfont=dict(color='#333333')
+            ),
+            angularaxis=dict(
+                gridcolor='#e5e5e5',
+                tickfont=dict(color='#333333')
+            ),
+            bgcolor='rgba(0,0,0,0)'
+        ),
+        showlegend=False,
+        height=350,
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        margin=dict(t=20, b=20)
+    )
+    return fig_radar
+
+
+def season_ratings(season_df):
+    """Mean episode rating per season with a one-std-dev band."""
+    import plotly.graph_objects as go
+
+    fig_seasons = go.Figure()
+    fig_seasons.add_trace(go.Scatter(
+        x=season_df['season'],
+        y=season_df['rating_mean'],
+        error_y=dict(type='data', array=season_df['rating_std'], color='#c9b3e0'),
+        customdata=season_df['episodes'],
+        hovertemplate="Season %{x}<br>Mean rating %{y:.2f}<br>%{customdata} episodes<extra></extra>",
+        mode='lines+markers',
+        line=dict(color='#610099', width=2)
+    ))
+    fig_seasons.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Season",
+        yaxis_title="Mean Episode Rating",
+        showlegend=False,
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        xaxis=dict(gridcolor='#e5e5e5', dtick=1),
+        yaxis=dict(gridcolor='#e5e5e5'),
+        height=300,
+        margin=dict(t=20, b=0)
+    )
+    return fig_seasons
+
+
+def rank_distribution(rank_counts, n_shows):
+    """Bar chart of a show's binned rank histogram from rank_stability."""
+    import plotly.express as px
+
+    bin_width = -(-n_shows // len(rank_counts))
+    occupied = np.flatnonzero(rank_counts)
+    rank_dist = pd.DataFrame({
+        'Rank': np.arange(occupied[0], occupied[-1] + 1) * bin_width + 1,
+        'Share': rank_counts[occupied[0]:occupied[-1] + 1] / rank_counts.sum() * 100
+    })
+
+    fig_rank = px.bar(
+        rank_dist,
+        x='Rank',
+        y='Share',
+        labels={'Share': 'Share of Samples (%)'},
+        color_discrete_sequence=['#610099']
+    )
+    fig_rank.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Rank",
+        yaxis_title="Share of Samples (%)",
+        showlegend=False,
+        font=dict(family="Inter, sans-serif", color="#333333"),
+        xaxis=dict(gridcolor='#e5e5e5'),
+        yaxis=dict(gridcolor='#e5e5e5'),
+        height=300,
+        margin=dict(t=20, b=0)
+    )
+    return fig_rank